@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterator
 
 log = logging.getLogger(__name__)
 
@@ -38,7 +38,7 @@ def chromium_date_added_to_datetime(value: str | int | None) -> datetime | None:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookmarkItem:
     url: str
     title: str | None
@@ -46,6 +46,12 @@ class BookmarkItem:
     id: str | None
     date_added_raw: str | None
     date_added: datetime | None
+    # Everything in the identity string after the URL, UTF-8 encoded once at construction.
+    _identity_tail: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        tail = f"\ndate_added={self.date_added_raw or ''}\nguid={self.guid or ''}\nid={self.id or ''}"
+        object.__setattr__(self, "_identity_tail", tail.encode("utf-8"))
 
     def identity_string(self, *, normalized_url: str) -> str:
         """
@@ -55,45 +61,43 @@ class BookmarkItem:
         are intended to remain stable for an item. We also include the (normalized) URL so obvious
         duplicates collapse better in later versions.
         """
-        return "\n".join(
-            [
-                f"url={normalized_url}",
-                f"date_added={self.date_added_raw or ''}",
-                f"guid={self.guid or ''}",
-                f"id={self.id or ''}",
-            ]
-        )
+        return f"url={normalized_url}" + self._identity_tail.decode("utf-8")
 
     def identity_sha256(self, *, normalized_url: str) -> str:
-        return sha256(self.identity_string(normalized_url=normalized_url).encode("utf-8")).hexdigest()
+        h = sha256(b"url=")
+        h.update(normalized_url.encode("utf-8"))
+        h.update(self._identity_tail)
+        return h.hexdigest()
 
 
 def load_bookmarks_file(path: Path) -> dict[str, Any]:
+    # Parse straight from the binary file object: the C scanner decodes the bytes itself, so we
+    # skip building an intermediate `str` copy of the whole (potentially multi-MB) file.
     try:
-        raw = path.read_text(encoding="utf-8")
+        with path.open("rb") as f:
+            data = json.load(f)
     except FileNotFoundError as e:
         raise BookmarksError(f"Bookmarks file not found: {path}") from e
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise BookmarksError(f"Bookmarks file is not valid JSON (maybe mid-write?): {path}") from e
     if not isinstance(data, dict):
         raise BookmarksError(f"Bookmarks JSON must be an object: {path}")
     return data
 
 
-def _iter_children(node: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    children = node.get("children")
-    if not isinstance(children, list):
-        return []
-    return [c for c in children if isinstance(c, dict)]
-
-
-def _walk(node: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    yield node
-    if node.get("type") == "folder":
-        for child in _iter_children(node):
-            yield from _walk(child)
+def _walk(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    Pre-order depth-first walk using an explicit stack (no recursive generator per folder).
+    """
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        yield n
+        if n.get("type") != "folder":
+            continue
+        children = n.get("children")
+        if isinstance(children, list):
+            stack.extend(c for c in reversed(children) if isinstance(c, dict))
 
 
 def find_folder(root: dict[str, Any], *, name: str) -> dict[str, Any] | None:
@@ -105,32 +109,83 @@ def find_folder(root: dict[str, Any], *, name: str) -> dict[str, Any] | None:
     return None
 
 
+def _field(node: dict[str, Any], key: str) -> str:
+    # JSON string values are already `str`; only coerce the odd number/null.
+    v = node.get(key)
+    if isinstance(v, str):
+        return v.strip()
+    return "" if v is None else str(v).strip()
+
+
+def _bookmark_item(node: dict[str, Any], titles: dict[str, str]) -> BookmarkItem | None:
+    """
+    `titles` is a per-parse memo so repeated labels (e.g. "YouTube") share one string object.
+    guid/id/date_added are unique per node, so they are not worth deduplicating.
+    """
+    url = _field(node, "url")
+    if not url:
+        return None
+    title = _field(node, "name") or None
+    if title is not None:
+        title = titles.setdefault(title, title)
+    date_raw = _field(node, "date_added") or None
+    return BookmarkItem(
+        url=url,
+        title=title,
+        guid=_field(node, "guid") or None,
+        id=_field(node, "id") or None,
+        date_added_raw=date_raw,
+        date_added=chromium_date_added_to_datetime(date_raw),
+    )
+
+
 def list_folder_bookmarks(folder: dict[str, Any]) -> list[BookmarkItem]:
     items: list[BookmarkItem] = []
+    titles: dict[str, str] = {}
     for node in _walk(folder):
         if node.get("type") != "url":
             continue
-        url = str(node.get("url", "")).strip()
-        if not url:
+        item = _bookmark_item(node, titles)
+        if item is not None:
+            items.append(item)
+    return items
+
+
+def collect_folder_bookmarks(root: dict[str, Any], *, name: str) -> list[BookmarkItem] | None:
+    """
+    Single-pass equivalent of `list_folder_bookmarks(find_folder(root, name=name))`.
+
+    Walks `root` until the first folder called `name`, then keeps walking only that folder's
+    subtree, collecting URL items as it goes. Returns None if no such folder exists.
+    """
+    stack = [root]
+    items: list[BookmarkItem] | None = None
+    titles: dict[str, str] = {}
+    while stack:
+        node = stack.pop()
+        kind = node.get("type")
+        if kind == "url":
+            if items is not None:
+                item = _bookmark_item(node, titles)
+                if item is not None:
+                    items.append(item)
+            continue
+        if kind != "folder":
             continue
-        title = str(node.get("name", "")).strip() or None
-        guid = str(node.get("guid", "")).strip() or None
-        node_id = str(node.get("id", "")).strip() or None
-        date_raw = str(node.get("date_added", "")).strip() or None
-        date_added = chromium_date_added_to_datetime(date_raw)
-        items.append(
-            BookmarkItem(
-                url=url,
-                title=title,
-                guid=guid,
-                id=node_id,
-                date_added_raw=date_raw,
-                date_added=date_added,
-            )
-        )
+        if items is None and str(node.get("name", "")).strip() == name:
+            # Found the folder: drop the rest of the tree and descend into this subtree only.
+            items = []
+            stack.clear()
+        children = node.get("children")
+        if isinstance(children, list):
+            stack.extend(c for c in reversed(children) if isinstance(c, dict))
     return items
 
 
+# (path, mtime_ns, size, root_name, inbox_folder_name) -> items from the last successful parse.
+_INBOX_CACHE: tuple[tuple[str, int, int, str, str], tuple[BookmarkItem, ...]] | None = None
+
+
 def load_brave_inbox_bookmarks(
     *,
     bookmarks_path: Path,
@@ -140,7 +195,34 @@ def load_brave_inbox_bookmarks(
     """
     Loads Brave/Chromium bookmarks JSON and returns URL items under:
       roots.<root_name>.<children>.../<Inbox folder>/<url items>
+
+    The result is cached by file mtime/size, so polling an unchanged file costs a single `stat()`.
     """
+    global _INBOX_CACHE
+
+    try:
+        st = bookmarks_path.stat()
+    except FileNotFoundError as e:
+        raise BookmarksError(f"Bookmarks file not found: {bookmarks_path}") from e
+    key = (str(bookmarks_path), st.st_mtime_ns, st.st_size, root_name, inbox_folder_name)
+    if _INBOX_CACHE is not None and _INBOX_CACHE[0] == key:
+        return list(_INBOX_CACHE[1])
+
+    items = _load_inbox_uncached(
+        bookmarks_path=bookmarks_path,
+        inbox_folder_name=inbox_folder_name,
+        root_name=root_name,
+    )
+    _INBOX_CACHE = (key, tuple(items))
+    return items
+
+
+def _load_inbox_uncached(
+    *,
+    bookmarks_path: Path,
+    inbox_folder_name: str,
+    root_name: str,
+) -> list[BookmarkItem]:
     data = load_bookmarks_file(bookmarks_path)
     roots = data.get("roots")
     if not isinstance(roots, dict):
@@ -150,9 +232,8 @@ def load_brave_inbox_bookmarks(
     if not isinstance(root, dict):
         raise BookmarksError(f"Bookmarks JSON missing roots.{root_name}: {bookmarks_path}")
 
-    inbox = find_folder(root, name=inbox_folder_name)
-    if inbox is None:
+    items = collect_folder_bookmarks(root, name=inbox_folder_name)
+    if items is None:
         log.info("Inbox folder not found: roots.%s/%s", root_name, inbox_folder_name)
         return []
-
-    return list_folder_bookmarks(inbox)
+    return items
@@ -7,51 +7,12 @@ from pathlib import Path
 
 from wmt.config import AppConfig, load_config
 from wmt.logging_setup import setup_logging
-from wmt.pipeline import process_one_from_inbox, process_url
+from wmt.pipeline import process_inbox, process_url, youtube_cache_dir
 from wmt.state import open_state_store
 from wmt.watcher import Watcher
 
 log = logging.getLogger(__name__)
 
-_GLOBAL_FLAGS = {"-v", "--verbose"}
-
-
-def _normalize_argv(argv: list[str]) -> list[str]:
-    """
-    Allow global flags (like --config / -v) to appear *after* the subcommand.
-    """
-    global_parts: list[str] = []
-    rest: list[str] = []
-
-    i = 0
-    while i < len(argv):
-        arg = argv[i]
-
-        if arg in _GLOBAL_FLAGS:
-            global_parts.append(arg)
-            i += 1
-            continue
-
-        if arg == "--config":
-            global_parts.append(arg)
-            if i + 1 < len(argv):
-                global_parts.append(argv[i + 1])
-                i += 2
-            else:
-                i += 1
-            continue
-
-        if arg.startswith("--config="):
-            global_parts.append(arg)
-            i += 1
-            continue
-
-        rest.append(arg)
-        i += 1
-
-    return global_parts + rest
-
-
 def _load(cfg_path: str | None, *, verbose: bool) -> AppConfig:
     cfg = load_config(Path(cfg_path).expanduser() if cfg_path else None)
     setup_logging(cfg.paths.log_file, verbose=verbose)
@@ -75,8 +36,7 @@ def cmd_process_one(args: argparse.Namespace) -> int:
     cfg = _load(args.config, verbose=args.verbose)
     state = open_state_store(path=cfg.state.path, backend=cfg.state.backend)
     try:
-        outcome = process_one_from_inbox(cfg, state=state, force=args.force)
-        if outcome:
+        for outcome in process_inbox(cfg, state=state, force=args.force):
             print(outcome.output_file)
         return 0
     finally:
@@ -116,23 +76,56 @@ def cmd_status(args: argparse.Namespace) -> int:
         state.close()
 
 
+def cmd_purge_cache(args: argparse.Namespace) -> int:
+    from wmt.yt_cache import purge_cache
+
+    cfg = _load(args.config, verbose=args.verbose)
+    cache_dir = youtube_cache_dir(cfg)
+    print(f"removed={purge_cache(cache_dir)} dir={cache_dir}")
+    return 0
+
+
+def _add_global_args(parser: argparse.ArgumentParser, *, suppress_defaults: bool = False) -> None:
+    parser.add_argument(
+        "--config",
+        default=argparse.SUPPRESS if suppress_defaults else None,
+        help="Path to config.yaml (default: auto)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        default=argparse.SUPPRESS if suppress_defaults else False,
+        help="Verbose logging",
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="wmt")
-    p.add_argument("--config", help="Path to config.yaml (default: auto)")
-    p.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
+    _add_global_args(p)
+
+    # Global flags may also appear *after* the subcommand. The subcommand copies use SUPPRESS
+    # defaults so they don't clobber values given before the subcommand.
+    common = argparse.ArgumentParser(add_help=False)
+    _add_global_args(common, suppress_defaults=True)
 
     sub = p.add_subparsers(dest="cmd", required=True)
 
-    w = sub.add_parser("watch", help="Watch Brave Inbox bookmarks and process new items")
+    w = sub.add_parser("watch", parents=[common], help="Watch Brave Inbox bookmarks and process new items")
     w.add_argument("--once", action="store_true", help="Process one stable update and exit")
     w.set_defaults(func=cmd_watch)
 
-    po = sub.add_parser("process-one", help="Process one unprocessed Inbox bookmark")
+    po = sub.add_parser(
+        "process-one",
+        parents=[common],
+        help="Process the oldest unprocessed Inbox bookmarks (up to processing.max_items_per_run, default 1)",
+    )
     po.add_argument("--force", action="store_true", help="Reprocess even if already processed/failed")
     po.set_defaults(func=cmd_process_one)
 
     pu = sub.add_parser(
         "process-url",
+        parents=[common],
         help="Process a URL (auto-fetches content; use --transcript-stdin to supply your own transcript)",
     )
     pu.add_argument("url", help="URL to analyse")
@@ -145,14 +138,16 @@ def build_parser() -> argparse.ArgumentParser:
     pu.add_argument("--force", action="store_true", help="Reprocess even if already processed/failed")
     pu.set_defaults(func=cmd_process_url)
 
-    st = sub.add_parser("status", help="Show ledger counts")
+    st = sub.add_parser("status", parents=[common], help="Show ledger counts")
     st.set_defaults(func=cmd_status)
 
+    pc = sub.add_parser("purge-cache", parents=[common], help="Delete cached YouTube metadata and transcripts")
+    pc.set_defaults(func=cmd_purge_cache)
+
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    raw = list(sys.argv[1:] if argv is None else argv)
-    args = parser.parse_args(_normalize_argv(raw))
+    args = parser.parse_args(argv)
     return int(args.func(args))
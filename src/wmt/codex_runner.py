@@ -41,67 +41,48 @@ class CodexResult:
     markdown: str
 
 
-def _ensure_output_last_message(cmd: list[str], output_path: Path) -> list[str]:
-    if any(part in {"-o", "--output-last-message"} for part in cmd):
-        return cmd
-
-    # Inject before prompt argument (`-`) if present.
-    try:
-        idx = cmd.index("-")
-    except ValueError:
-        cmd = cmd + ["-"]
-        idx = len(cmd) - 1
-
-    return cmd[:idx] + ["--output-last-message", str(output_path)] + cmd[idx:]
-
-
-def _inject_model(cmd: list[str], model: str) -> list[str]:
-    model = model.strip()
-    if not model:
-        return cmd
-    if any(part in {"-m", "--model"} for part in cmd):
-        return cmd
-    try:
-        idx = cmd.index("-")
-    except ValueError:
-        idx = len(cmd)
-    return cmd[:idx] + ["--model", model] + cmd[idx:]
-
-
-def _inject_reasoning_effort(cmd: list[str], reasoning_effort: str) -> list[str]:
-    reasoning_effort = reasoning_effort.strip()
-    if not reasoning_effort:
-        return cmd
-
-    # If the user already supplied a config override for this, respect it.
-    for part in cmd:
-        if "model_reasoning_effort" in part:
-            return cmd
-
-    try:
-        idx = cmd.index("-")
-    except ValueError:
-        idx = len(cmd)
-
-    # Codex CLI parses the value as TOML, so we must quote the string.
-    return cmd[:idx] + ["-c", f'model_reasoning_effort="{reasoning_effort}"'] + cmd[idx:]
-
-
-def _inject_web_search(cmd: list[str], enabled: bool) -> list[str]:
-    if not enabled:
-        return cmd
-    if "--search" in cmd:
-        return cmd
-
-    # `--search` is a global flag and must appear before the `exec` subcommand.
-    for subcmd in ("exec", "e"):
-        if subcmd in cmd:
-            idx = cmd.index(subcmd)
-            return cmd[:idx] + ["--search"] + cmd[idx:]
-
-    # Fallback: insert right after the binary.
-    if cmd:
-        return [cmd[0], "--search", *cmd[1:]]
+def _build_codex_cmd(base: list[str], cfg: CodexConfig, *, output_path: Path) -> list[str]:
+    """
+    Builds the final Codex argv from `codex.command` in one pass, respecting anything the user
+    already put there:
+
+    - `--search` (global flag) goes before the `exec`/`e` subcommand, else right after the binary.
+    - `--output-last-message <path>`, `--model`, and `-c model_reasoning_effort="..."` go just
+      before the `-` prompt argument (which is appended if missing and we need the output file).
+    """
+    present = set(base)
+    inject: list[str] = []
+    add_dash = False
+    if "-o" not in present and "--output-last-message" not in present:
+        inject += ["--output-last-message", str(output_path)]
+        add_dash = "-" not in present
+    model = cfg.model.strip()
+    if model and "-m" not in present and "--model" not in present:
+        inject += ["--model", model]
+    effort = cfg.model_reasoning_effort.strip()
+    if effort and not any("model_reasoning_effort" in part for part in base):
+        # Codex CLI parses the value as TOML, so we must quote the string.
+        inject += ["-c", f'model_reasoning_effort="{effort}"']
+
+    dash_idx = base.index("-") if "-" in present else len(base)
+    inserts: list[tuple[int, list[str]]] = []
+    if cfg.web_search_enabled and "--search" not in present and base:
+        search_idx = 1
+        for subcmd in ("exec", "e"):
+            if subcmd in present:
+                search_idx = base.index(subcmd)
+                break
+        inserts.append((search_idx, ["--search"]))
+    inserts.append((dash_idx, inject + (["-"] if add_dash else [])))
+    inserts.sort(key=lambda pair: pair[0])
+
+    cmd: list[str] = []
+    prev = 0
+    for idx, parts in inserts:
+        cmd.extend(base[prev:idx])
+        cmd.extend(parts)
+        prev = idx
+    cmd.extend(base[prev:])
     return cmd
 
 
@@ -112,23 +93,27 @@ def run_codex(cfg: CodexConfig, *, stdin_prompt: str) -> CodexResult:
         raise CodexError("codex.command is empty")
 
     base_cmd = list(cfg.command)
+    # Encode once up front and talk to Codex in binary mode (no text-mode wrapper around stdin).
+    prompt_bytes = stdin_prompt.encode("utf-8")
     env = dict(os.environ)
     env.setdefault("NO_COLOR", "1")
 
-    with tempfile.TemporaryDirectory(prefix="wmt_codex_") as tmp:
-        out_path = Path(tmp) / "codex_last_message.txt"
-        cmd = _inject_web_search(base_cmd, cfg.web_search_enabled)
-        cmd = _ensure_output_last_message(cmd, out_path)
-        cmd = _inject_model(cmd, cfg.model)
-        cmd = _inject_reasoning_effort(cmd, cfg.model_reasoning_effort)
+    # A single temp file (rather than a temp dir) for Codex's last message: one mkstemp + one unlink.
+    fd, tmp_name = tempfile.mkstemp(prefix="wmt_codex_", suffix="_last_message.txt")
+    os.close(fd)
+    out_path = Path(tmp_name)
+    try:
+        cmd = _build_codex_cmd(base_cmd, cfg, output_path=out_path)
 
         log.info("Running Codex: %s", " ".join(cmd))
         try:
+            # The answer comes from --output-last-message, so stdout (the full transcript of the
+            # session) is discarded rather than buffered; stderr is kept for error reporting.
             subprocess.run(
                 cmd,
-                input=stdin_prompt,
-                text=True,
-                capture_output=True,
+                input=prompt_bytes,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=cfg.timeout_seconds,
                 env=env,
                 check=True,
@@ -149,9 +134,7 @@ def run_codex(cfg: CodexConfig, *, stdin_prompt: str) -> CodexResult:
                 f"(increase codex.timeout_seconds in config.yaml)"
             ) from e
         except subprocess.CalledProcessError as e:
-            stderr = (e.stderr or "").strip()
-            stdout = (e.stdout or "").strip()
-            detail = stderr or stdout or f"exit {e.returncode}"
+            detail = (e.stderr or b"").decode("utf-8", errors="replace").strip() or f"exit {e.returncode}"
             raise CodexFailedError(f"Codex failed: {detail}") from e
 
         if out_path.exists():
@@ -161,3 +144,5 @@ def run_codex(cfg: CodexConfig, *, stdin_prompt: str) -> CodexResult:
         if not text:
             raise CodexEmptyOutputError("Codex produced no output (empty last message)")
         return CodexResult(markdown=text)
+    finally:
+        out_path.unlink(missing_ok=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,9 +12,25 @@ class ConfigError(RuntimeError):
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise ConfigError(f"Config not found: {path}")
+    """
+    Parsed config file contents, cached by (path, mtime_ns, size).
 
+    Only the YAML parse is cached: env-var lookups and validation in `load_config` still run on
+    every call. The returned dict is shared between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError as e:
+        raise ConfigError(f"Config not found: {path}") from e
+    return _parse_yaml_file(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    return _parse_yaml(path.read_bytes(), origin=str(path))
+
+
+def _parse_yaml(source: str | bytes, *, origin: str) -> dict[str, Any]:
     try:
         import yaml  # type: ignore[import-not-found]
     except ImportError as e:
@@ -21,15 +38,17 @@ def _load_yaml(path: Path) -> dict[str, Any]:
             "PyYAML is required to parse config.yaml. Install it with: pip install pyyaml"
         ) from e
 
+    # Prefer the libyaml-backed loader (bundled with PyYAML wheels); same safe semantics, parsed in C.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        parsed = yaml.safe_load(path.read_text(encoding="utf-8"))
+        parsed = yaml.load(source, Loader=loader)
     except Exception as e:
-        raise ConfigError(f"Invalid YAML in {path}: {e}") from e
+        raise ConfigError(f"Invalid YAML in {origin}: {e}") from e
 
     if parsed is None:
         return {}
     if not isinstance(parsed, dict):
-        raise ConfigError(f"Invalid config: expected a top-level mapping in {path}")
+        raise ConfigError(f"Invalid config: expected a top-level mapping in {origin}")
     return parsed
 
 
@@ -46,7 +65,12 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
 def _expand_path(value: str | None) -> Path | None:
     if value is None:
         return None
-    return Path(os.path.expandvars(value)).expanduser()
+    # Only run the expansions that can apply; most configured paths are plain or `~/...`.
+    if "$" in value or "%" in value:
+        value = os.path.expandvars(value)
+    if value.startswith("~"):
+        value = os.path.expanduser(value)
+    return Path(value)
 
 
 def _optional_path(value: Any) -> Path | None:
@@ -58,6 +82,14 @@ def _optional_path(value: Any) -> Path | None:
     return _expand_path(s)
 
 
+def _command_tuple(value: Any) -> tuple[str, ...]:
+    # YAML already yields `str` items; only coerce the odd scalar (e.g. a bare number argument).
+    if not isinstance(value, (list, tuple)):
+        return ()
+    parts = (x if isinstance(x, str) else str(x) for x in value)
+    return tuple(p for p in parts if p.strip())
+
+
 @dataclass(frozen=True)
 class PathsConfig:
     bookmarks_file: Path
@@ -84,6 +116,7 @@ class ProcessingConfig:
     poll_interval_seconds: int
     in_progress_ttl_seconds: int
     max_items_per_run: int
+    force_polling: bool
 
 
 @dataclass(frozen=True)
@@ -138,6 +171,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "poll_interval_seconds": 30,
         "in_progress_ttl_seconds": 3600,
         "max_items_per_run": 1,
+        "force_polling": False,
     },
     "fetch": {
         "timeout_seconds": 20,
@@ -177,7 +211,20 @@ def default_config_path() -> Path:
 
 def load_config(path: Path | None = None) -> AppConfig:
     config_path = (path or default_config_path()).expanduser()
-    data = _load_yaml(config_path)
+    return _build_config(_load_yaml(config_path), config_path=config_path.resolve())
+
+
+def load_config_from_text(text: str, *, config_path: Path | None = None) -> AppConfig:
+    """
+    Like `load_config`, but parses YAML `text` instead of reading a file (nothing is cached).
+
+    `config_path` is only recorded on the result; it defaults to `config.yaml` in the cwd.
+    """
+    config_path = (config_path or Path("config.yaml")).expanduser()
+    return _build_config(_parse_yaml(text, origin="<text>"), config_path=config_path.resolve())
+
+
+def _build_config(data: dict[str, Any], *, config_path: Path) -> AppConfig:
     merged = _deep_merge(DEFAULT_CONFIG, data)
 
     paths = merged.get("paths", {})
@@ -227,6 +274,7 @@ def load_config(path: Path | None = None) -> AppConfig:
             poll_interval_seconds=int(processing.get("poll_interval_seconds", 30)),
             in_progress_ttl_seconds=int(processing.get("in_progress_ttl_seconds", 3600)),
             max_items_per_run=int(processing.get("max_items_per_run", 1)),
+            force_polling=bool(processing.get("force_polling", False)),
         ),
         fetch=FetchConfig(
             timeout_seconds=int(fetch.get("timeout_seconds", 20)),
@@ -235,7 +283,7 @@ def load_config(path: Path | None = None) -> AppConfig:
         ),
         codex=CodexConfig(
             enabled=bool(codex.get("enabled", True)),
-            command=tuple(str(x) for x in codex.get("command", []) if str(x).strip()),
+            command=_command_tuple(codex.get("command")),
             model=str(codex.get("model", "")).strip(),
             model_reasoning_effort=str(codex.get("model_reasoning_effort", "")).strip(),
             web_search_enabled=bool(codex.get("web_search_enabled", True)),
@@ -248,5 +296,5 @@ def load_config(path: Path | None = None) -> AppConfig:
             parent_folder_id=parent_folder_id,
             timeout_seconds=hackmd_timeout,
         ),
-        config_path=config_path.resolve(),
+        config_path=config_path,
     )
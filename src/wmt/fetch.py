@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import gzip
+import codecs
 import logging
 import re
 import zlib
 from dataclasses import dataclass
 from html.parser import HTMLParser
+from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -22,8 +23,16 @@ _UA = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Request copies these into its own dict, so sharing one mapping across calls is safe.
+_DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": _UA,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9,en-US;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FetchResult:
     url: str
     final_url: str | None
@@ -37,10 +46,20 @@ class FetchResult:
     error: str | None
 
 
+_CHARSET_HDR_RE = re.compile(r"charset=([A-Za-z0-9._-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9._-]+)', re.IGNORECASE)
+
+
 def _decode_body(body: bytes, *, content_type: str | None) -> str:
+    # A BOM is authoritative, whatever the headers say.
+    if body.startswith(codecs.BOM_UTF8):
+        return body[len(codecs.BOM_UTF8) :].decode("utf-8", errors="replace")
+    if body.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return body.decode("utf-16", errors="replace")
+
     charset: str | None = None
     if content_type:
-        m = re.search(r"charset=([A-Za-z0-9._-]+)", content_type, flags=re.IGNORECASE)
+        m = _CHARSET_HDR_RE.search(content_type)
         if m:
             charset = m.group(1).strip()
 
@@ -52,19 +71,118 @@ def _decode_body(body: bytes, *, content_type: str | None) -> str:
         except UnicodeDecodeError:
             pass
 
+    # Pure ASCII decodes the same under any ASCII-compatible charset; no sniffing needed.
+    if body.isascii():
+        return body.decode("ascii")
+
     # Light-touch HTML meta charset sniff.
-    head = body[:4096].decode("utf-8", errors="ignore")
-    m = re.search(r'(?i)<meta[^>]+charset=["\']?([A-Za-z0-9._-]+)', head)
+    m = _META_CHARSET_RE.search(body, 0, 4096)
     if m:
-        guessed = m.group(1).strip()
+        guessed = m.group(1).decode("ascii")
         try:
             return body.decode(guessed, errors="replace")
         except Exception:
             pass
 
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    guessed_text = _guess_decode(body)
+    if guessed_text is not None:
+        return guessed_text
+
     return body.decode("utf-8", errors="replace")
 
 
+def _guess_decode(body: bytes) -> str | None:
+    try:
+        from charset_normalizer import from_bytes  # type: ignore[import-not-found]
+    except ImportError:
+        # Optional: without it, undeclared non-UTF-8 bodies fall back to utf-8 with replacement.
+        return None
+    try:
+        best = from_bytes(body).best()
+    except Exception as e:
+        log.debug("charset detection failed: %s", e)
+        return None
+    return str(best) if best is not None else None
+
+
+_READ_CHUNK = 64 * 1024
+# deflate is nominally zlib-wrapped, but some servers send raw deflate.
+_WBITS = {"gzip": (16 + zlib.MAX_WBITS,), "deflate": (zlib.MAX_WBITS, -zlib.MAX_WBITS)}
+
+
+def _read_capped(resp: Any, max_bytes: int, *, content_encoding: str | None = None) -> tuple[bytes, bool]:
+    """
+    Reads at most `max_bytes` (plus one byte to detect truncation) in chunks into a single buffer,
+    so memory tracks the actual body size rather than the cap. Returns (body, truncated).
+
+    gzip/deflate bodies are inflated as they are read, so the cap applies to the decoded text. If
+    the first chunk does not decompress, the body is passed through as-is (mislabelled encoding);
+    a stream that breaks later keeps whatever was inflated before the error.
+    """
+    enc = (content_encoding or "").strip().lower()
+    wbits_options = _WBITS.get(enc, ())
+    decomp: Any = None
+    buf = bytearray()
+    while len(buf) <= max_bytes:
+        limit = max_bytes + 1 - len(buf)
+        chunk = resp.read(_READ_CHUNK if wbits_options else min(_READ_CHUNK, limit))
+        if not chunk:
+            break
+        if not wbits_options:
+            buf += chunk
+            continue
+        if decomp is None:
+            for wbits in wbits_options:
+                try:
+                    candidate = zlib.decompressobj(wbits)
+                    data = candidate.decompress(chunk, limit)
+                except zlib.error:
+                    continue
+                decomp = candidate
+                break
+            else:
+                wbits_options = ()
+                buf += chunk
+                continue
+        else:
+            try:
+                data = decomp.decompress(chunk, limit)
+            except zlib.error:
+                decomp = None
+                break
+        buf += data
+    if decomp is not None and len(buf) <= max_bytes:
+        try:
+            buf += decomp.flush()
+        except zlib.error:
+            pass
+    truncated = len(buf) > max_bytes
+    if truncated:
+        del buf[max_bytes:]
+    return bytes(buf), truncated
+
+
+_TEXTUAL_APPLICATION_TYPES = frozenset({"application/xhtml+xml", "application/xml", "application/json"})
+
+
+def _is_textual(content_type: str | None) -> bool:
+    """
+    True when the body is worth reading as text. A missing Content-Type is given the benefit of
+    the doubt.
+    """
+    if not content_type:
+        return True
+    mime = content_type.split(";", 1)[0].strip().lower()
+    if not mime or mime.startswith("text/") or mime in _TEXTUAL_APPLICATION_TYPES:
+        return True
+    return mime.endswith(("+json", "+xml"))
+
+
 def fetch_url(
     url: str,
     *,
@@ -75,15 +193,7 @@ def fetch_url(
     if not url:
         raise FetchError("Empty URL")
 
-    req = Request(
-        url,
-        headers={
-            "User-Agent": _UA,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-GB,en;q=0.9,en-US;q=0.8",
-            "Accept-Encoding": "gzip, deflate",
-        },
-    )
+    req = Request(url, headers=_DEFAULT_HEADERS)
 
     body: bytes = b""
     status: int | None = None
@@ -94,31 +204,40 @@ def fetch_url(
 
     try:
         with urlopen(req, timeout=timeout_seconds) as resp:
-            status = getattr(resp, "status", None)
-            final_url = getattr(resp, "url", None)
-            content_type = resp.headers.get("Content-Type")
-            content_encoding = resp.headers.get("Content-Encoding")
-            body = resp.read(max_bytes + 1)
-            if len(body) > max_bytes:
-                body = body[:max_bytes]
-                truncated = True
+            status = resp.status
+            final_url = resp.url
+            headers = resp.headers
+            content_type = headers.get("Content-Type")
+            content_encoding = headers.get("Content-Encoding")
+            if not _is_textual(content_type):
+                # PDFs, video, images...: nothing we can extract, so don't download the body.
+                return FetchResult(
+                    url=url,
+                    final_url=final_url,
+                    ok=False,
+                    status=status,
+                    content_type=content_type,
+                    content_encoding=content_encoding,
+                    bytes_read=0,
+                    truncated=False,
+                    text=None,
+                    error=f"Unsupported content type: {content_type}",
+                )
+            body, truncated = _read_capped(resp, max_bytes, content_encoding=content_encoding)
     except HTTPError as e:
         status = getattr(e, "code", None)
         final_url = getattr(e, "url", None)
-        content_type = e.headers.get("Content-Type") if e.headers else None
-        content_encoding = e.headers.get("Content-Encoding") if e.headers else None
+        headers = e.headers
+        content_type = headers.get("Content-Type") if headers else None
+        content_encoding = headers.get("Content-Encoding") if headers else None
         try:
-            body = e.read(max_bytes + 1)
-            if len(body) > max_bytes:
-                body = body[:max_bytes]
-                truncated = True
+            body, truncated = _read_capped(e, max_bytes, content_encoding=content_encoding)
         except Exception:
             body = b""
         error = (str(e) or f"HTTP {status}").strip()
         text = None
         if body:
             try:
-                body = _maybe_decompress(body, content_encoding=content_encoding)
                 text = _decode_body(body, content_type=content_type)
             except Exception:
                 text = None
@@ -148,9 +267,8 @@ def fetch_url(
             error=str(e.reason) if getattr(e, "reason", None) else str(e),
         )
 
-    body = _maybe_decompress(body, content_encoding=content_encoding)
     text = _decode_body(body, content_type=content_type) if body else ""
-    ok = bool(status and 200 <= int(status) < 400)
+    ok = status is not None and 200 <= status < 400
     return FetchResult(
         url=url,
         final_url=final_url,
@@ -165,33 +283,23 @@ def fetch_url(
     )
 
 
-def _maybe_decompress(body: bytes, *, content_encoding: str | None) -> bytes:
-    enc = (content_encoding or "").strip().lower()
-    if not enc:
-        return body
-    if enc == "gzip":
-        try:
-            return gzip.decompress(body)
-        except Exception:
-            return body
-    if enc == "deflate":
-        try:
-            return zlib.decompress(body)
-        except Exception:
-            try:
-                return zlib.decompress(body, -zlib.MAX_WBITS)
-            except Exception:
-                return body
-    return body
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractedPage:
     title: str | None
     text: str
 
 
+_IGNORED_TAGS = frozenset({"script", "style", "noscript"})
+_BREAK_BEFORE_TAGS = frozenset({"p", "br", "div", "li", "h1", "h2", "h3", "h4", "h5", "h6", "tr"})
+_BREAK_AFTER_TAGS = frozenset({"p", "div", "li"})
+# Only runs that actually change: single spaces (most of prose) are left alone.
+_WS_RE = re.compile(r" [ \t]+|\t[ \t]*")
+_NL_RE = re.compile(r"\n{3,}")
+
+
 class _HTMLTextExtractor(HTMLParser):
+    # Note: HTMLParser already lowercases tag names before calling the handlers.
+
     def __init__(self) -> None:
         super().__init__(convert_charrefs=True)
         self._chunks: list[str] = []
@@ -200,25 +308,23 @@ class _HTMLTextExtractor(HTMLParser):
         self._title_chunks: list[str] = []
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        lowered = tag.lower()
-        if lowered in {"script", "style", "noscript"}:
+        if tag in _IGNORED_TAGS:
             self._in_ignored += 1
             return
-        if lowered == "title":
+        if tag == "title":
             self._in_title = True
             return
-        if lowered in {"p", "br", "div", "li", "h1", "h2", "h3", "h4", "h5", "h6", "tr"}:
+        if tag in _BREAK_BEFORE_TAGS:
             self._chunks.append("\n")
 
     def handle_endtag(self, tag: str) -> None:
-        lowered = tag.lower()
-        if lowered in {"script", "style", "noscript"}:
+        if tag in _IGNORED_TAGS:
             self._in_ignored = max(0, self._in_ignored - 1)
             return
-        if lowered == "title":
+        if tag == "title":
             self._in_title = False
             return
-        if lowered in {"p", "div", "li"}:
+        if tag in _BREAK_AFTER_TAGS:
             self._chunks.append("\n")
 
     def handle_data(self, data: str) -> None:
@@ -236,10 +342,11 @@ class _HTMLTextExtractor(HTMLParser):
 
     def text(self) -> str:
         raw = "".join(self._chunks)
-        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+        if "\r" in raw:
+            raw = raw.replace("\r\n", "\n").replace("\r", "\n")
         # Collapse whitespace but keep paragraph-ish newlines.
-        raw = re.sub(r"[ \t]+", " ", raw)
-        raw = re.sub(r"\n{3,}", "\n\n", raw)
+        raw = _WS_RE.sub(" ", raw)
+        raw = _NL_RE.sub("\n\n", raw)
         return raw.strip()
 
 
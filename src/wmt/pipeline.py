@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlsplit
 
 from wmt.bookmarks import BookmarkItem, BookmarksError, load_brave_inbox_bookmarks
@@ -14,22 +16,27 @@ from wmt.codex_runner import (
     CodexError,
     CodexFailedError,
     CodexNotFoundError,
+    CodexResult,
     CodexTimeoutError,
     run_codex,
 )
 from wmt.config import AppConfig
-from wmt.publish import publish_all
-from wmt.state import StateStore
+from wmt.state import StateStore, ThreadSafeStateStore
 from wmt.triage_output import atomic_write_text, triage_output_path
 from wmt.triage_prompt import build_triage_prompt
 from wmt.urls import is_probably_http_url, normalize_url
-from wmt.youtube_metadata import YouTubeMetadata, get_youtube_metadata
-from wmt.youtube_transcripts import get_youtube_transcript, is_youtube_url
+from wmt.youtube_transcripts import is_youtube_url
+
+# Publishing and YouTube metadata pull in urllib/http.client; they're imported where used so
+# `wmt --help`, `wmt status` etc. start quickly.
+if TYPE_CHECKING:
+    from wmt.publishers.base import PublishResult
+    from wmt.youtube_metadata import YouTubeMetadata
 
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessOutcome:
     item_id: str
     url: str
@@ -97,6 +104,9 @@ def _fallback_markdown(
     return markdown
 
 
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MAX_WORKERS = 8
+
 _H1_RE = re.compile(r"^\s*#\s+(.+?)\s*$")
 _TRAILING_EXT_RE = re.compile(r"\.[a-z0-9]{1,6}$", re.IGNORECASE)
 
@@ -192,6 +202,11 @@ def _format_youtube_metadata(meta: YouTubeMetadata | None) -> str:
     return "\n".join(lines).strip()
 
 
+def youtube_cache_dir(cfg: AppConfig) -> Path:
+    # Next to the state ledger rather than in output_dir, which is usually a synced notes folder.
+    return cfg.state.path.expanduser().parent / "cache" / "youtube"
+
+
 def _build_transcript_payload(
     cfg: AppConfig,
     *,
@@ -210,11 +225,14 @@ def _build_transcript_payload(
     normalized = normalize_url(url)
 
     if is_youtube_url(normalized):
-        meta = get_youtube_metadata(normalized, timeout_seconds=cfg.fetch.timeout_seconds)
+        from wmt.yt_cache import get_cached_metadata, get_cached_transcript
+
+        cache_dir = youtube_cache_dir(cfg)
+        meta = get_cached_metadata(normalized, cache_dir=cache_dir, timeout_seconds=cfg.fetch.timeout_seconds)
         extracted_title = meta.title if meta and meta.title else title_hint
         metadata_payload = _format_youtube_metadata(meta)
 
-        yt = get_youtube_transcript(normalized)
+        yt = get_cached_transcript(normalized, cache_dir=cache_dir, timeout_seconds=cfg.fetch.timeout_seconds)
         if yt and yt.text.strip():
             log.info(
                 "Retrieved YouTube transcript via %s (chars=%s)",
@@ -241,6 +259,39 @@ def _build_transcript_payload(
     return "", title_hint, ""
 
 
+def _run_triage(
+    cfg: AppConfig,
+    *,
+    link: str,
+    transcript: str,
+    metadata: str,
+    output_file: Path,
+) -> CodexResult:
+    # run_codex would refuse anyway; check first so we don't read/render the prompt for nothing.
+    if not cfg.codex.enabled:
+        raise CodexDisabledError("Codex is disabled in config")
+    stdin_prompt = build_triage_prompt(
+        link=link,
+        transcript=transcript,
+        metadata=metadata,
+        output_file=str(output_file),
+        prompt_file=cfg.paths.triage_prompt_file,
+    )
+    return run_codex(cfg.codex, stdin_prompt=stdin_prompt)
+
+
+def _log_publish_result(fut: Future[PublishResult]) -> None:
+    try:
+        res = fut.result()
+    except Exception:
+        log.exception("Publish raised unexpectedly")
+        return
+    if not res.ok:
+        log.warning("Publish failed (%s): %s", res.publisher, res.error)
+    else:
+        log.info("Published (%s): %s", res.publisher, res.url or res.note_id or "ok")
+
+
 def _should_skip_due_to_state(state: StateStore, item_id: str, *, force: bool) -> bool:
     if force:
         return False
@@ -297,40 +348,43 @@ def process_bookmark_item(
     # Prefer extracted metadata title (e.g. YouTube oEmbed) over the bookmark's saved label,
     # which often includes noise like " - YouTube" or user-added numbering.
     title_for_filename = extracted_title or bookmark.title or "Untitled"
+
     output_file = triage_output_path(cfg.paths.output_dir.expanduser(), title=title_for_filename)
     log.info("Writing analysis to: %s", output_file)
+    try:
+        try:
+            result = _run_triage(
+                cfg,
+                link=normalized_url,
+                transcript=transcript_payload,
+                metadata=metadata_payload,
+                output_file=output_file,
+            )
+            markdown = result.markdown.strip()
+            codex_status = "ok"
+        except CodexError as e:
+            codex_status, codex_label, tip = _codex_failure_details(e)
+            basis = "Transcript provided" if transcript_payload.strip() else "Link only"
+            markdown = _fallback_markdown(
+                title=title_for_filename,
+                url=normalized_url,
+                basis=basis,
+                transcript_payload=transcript_payload,
+                codex_label=codex_label,
+                tip=tip,
+                error=e,
+            )
 
-    stdin_prompt = build_triage_prompt(
-        link=normalized_url,
-        transcript=transcript_payload,
-        metadata=metadata_payload,
-        output_file=str(output_file),
-        prompt_file=cfg.paths.triage_prompt_file,
-    )
+        atomic_write_text(output_file, markdown)
+    except BaseException:
+        # Don't leave the reserved (still empty) file behind.
+        output_file.unlink(missing_ok=True)
+        raise
 
-    try:
-        result = run_codex(cfg.codex, stdin_prompt=stdin_prompt)
-        markdown = result.markdown.strip()
-        codex_status = "ok"
-    except CodexError as e:
-        codex_status, codex_label, tip = _codex_failure_details(e)
-        basis = "Transcript provided" if transcript_payload.strip() else "Link only"
-        markdown = _fallback_markdown(
-            title=title_for_filename,
-            url=normalized_url,
-            basis=basis,
-            transcript_payload=transcript_payload,
-            codex_label=codex_label,
-            tip=tip,
-            error=e,
-        )
+    from wmt.publish import submit_publish_all
 
-    atomic_write_text(output_file, markdown)
-    for res in publish_all(cfg, markdown=markdown):
-        if not res.ok:
-            log.warning("Publish failed (%s): %s", res.publisher, res.error)
-        else:
-            log.info("Published (%s): %s", res.publisher, res.url or res.note_id or "ok")
+    for fut in submit_publish_all(cfg, markdown=markdown):
+        fut.add_done_callback(_log_publish_result)
     state.mark_processed(
         item_id,
         archive_path=None,
@@ -348,12 +402,38 @@ def process_bookmark_item(
     )
 
 
-def process_one_from_inbox(
+def _process_bookmark_guarded(
     cfg: AppConfig,
     *,
+    bookmark: BookmarkItem,
     state: StateStore,
-    force: bool = False,
+    force: bool,
 ) -> ProcessOutcome | None:
+    try:
+        return process_bookmark_item(cfg, bookmark=bookmark, state=state, force=force)
+    except Exception:
+        log.exception("Failed processing bookmark: %s", bookmark.url)
+        try:
+            normalized = normalize_url(bookmark.url)
+            item_id = bookmark.identity_sha256(normalized_url=normalized)
+            state.mark_failed(item_id, "Unhandled exception (see logs)")
+        except Exception:
+            pass
+        return None
+
+
+def process_inbox(
+    cfg: AppConfig,
+    *,
+    state: StateStore,
+    force: bool = False,
+) -> list[ProcessOutcome]:
+    """
+    Process up to `processing.max_items_per_run` unprocessed Inbox bookmarks, oldest first.
+
+    With a limit above 1, bookmarks are processed concurrently (the work is mostly waiting on
+    Codex and the network); state access is serialized through a lock.
+    """
     try:
         bookmarks = load_brave_inbox_bookmarks(
             bookmarks_path=cfg.paths.bookmarks_file,
@@ -362,37 +442,61 @@ def process_one_from_inbox(
         )
     except BookmarksError as e:
         log.warning("Failed to read bookmarks: %s", e)
-        return None
+        return []
 
-    def sort_key(b: BookmarkItem) -> tuple[int, str]:
-        dt = b.date_added or datetime(1970, 1, 1, tzinfo=timezone.utc)
-        return (int(dt.timestamp()), b.url)
+    def sort_key(b: BookmarkItem) -> tuple[datetime, str]:
+        return (b.date_added or _UNIX_EPOCH, b.url)
 
     bookmarks.sort(key=sort_key)
     if not bookmarks:
         log.info("Inbox folder has no URL bookmarks: %s", cfg.bookmarks.inbox_folder_name)
-        return None
+        return []
 
-    processed = 0
-    for b in bookmarks:
-        if processed >= max(1, cfg.processing.max_items_per_run):
-            break
-        try:
-            outcome = process_bookmark_item(cfg, bookmark=b, state=state, force=force)
+    limit = max(1, cfg.processing.max_items_per_run)
+    outcomes: list[ProcessOutcome] = []
+    if limit == 1:
+        for b in bookmarks:
+            outcome = _process_bookmark_guarded(cfg, bookmark=b, state=state, force=force)
             if outcome:
-                processed += 1
-                return outcome
-        except Exception:
-            log.exception("Failed processing bookmark: %s", b.url)
-            try:
-                normalized = normalize_url(b.url)
-                item_id = b.identity_sha256(normalized_url=normalized)
-                state.mark_failed(item_id, "Unhandled exception (see logs)")
-            except Exception:
-                pass
-
-    log.info("No unprocessed bookmarks found in Inbox (nothing to do).")
-    return None
+                outcomes.append(outcome)
+                break
+    else:
+        outcomes = _process_concurrently(cfg, bookmarks, state=ThreadSafeStateStore(state), force=force, limit=limit)
+
+    if not outcomes:
+        log.info("No unprocessed bookmarks found in Inbox (nothing to do).")
+    return outcomes
+
+
+def _process_concurrently(
+    cfg: AppConfig,
+    bookmarks: list[BookmarkItem],
+    *,
+    state: StateStore,
+    force: bool,
+    limit: int,
+) -> list[ProcessOutcome]:
+    # Keep at most `limit` items in flight, topping up from the queue as skipped/failed items
+    # come back empty, so we stop once `limit` items have actually been processed.
+    outcomes: list[ProcessOutcome] = []
+    queue = iter(bookmarks)
+    workers = min(_MAX_WORKERS, limit)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: set[Future[ProcessOutcome | None]] = set()
+        while True:
+            while len(outcomes) + len(in_flight) < limit and len(in_flight) < workers:
+                b = next(queue, None)
+                if b is None:
+                    break
+                in_flight.add(pool.submit(_process_bookmark_guarded, cfg, bookmark=b, state=state, force=force))
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                outcome = fut.result()
+                if outcome:
+                    outcomes.append(outcome)
+    return outcomes
 
 
 def process_url(
@@ -437,10 +541,16 @@ def process_url(
     )
 
     if transcript is not None and transcript.strip():
+        from wmt.yt_cache import get_cached_metadata
+
         payload = "TRANSCRIPT PROVIDED BY USER:\n\n" + transcript.strip()
         payload, _trunc = _truncate(payload, max_chars=cfg.fetch.max_transcript_chars)
         meta = (
-            get_youtube_metadata(normalized_url, timeout_seconds=cfg.fetch.timeout_seconds)
+            get_cached_metadata(
+                normalized_url,
+                cache_dir=youtube_cache_dir(cfg),
+                timeout_seconds=cfg.fetch.timeout_seconds,
+            )
             if is_youtube_url(normalized_url)
             else None
         )
@@ -459,48 +569,53 @@ def process_url(
     title_hint = title or extracted_title or _title_hint_from_url(normalized_url) or "Untitled"
     planned_output_file = triage_output_path(cfg.paths.output_dir.expanduser(), title=title_hint)
     log.info("Processing URL: %s", normalized_url)
-
-    stdin_prompt = build_triage_prompt(
-        link=normalized_url,
-        transcript=payload,
-        metadata=metadata_payload,
-        output_file=str(planned_output_file),
-        prompt_file=cfg.paths.triage_prompt_file,
-    )
-
-    try:
-        result = run_codex(cfg.codex, stdin_prompt=stdin_prompt)
-        markdown = result.markdown.strip()
-        codex_status = "ok"
-    except CodexError as e:
-        codex_status, codex_label, tip = _codex_failure_details(e)
-        basis = "Transcript provided" if payload.strip() else "Link only"
-        markdown = _fallback_markdown(
-            title=title_hint,
-            url=normalized_url,
-            basis=basis,
-            transcript_payload=payload,
-            codex_label=codex_label,
-            tip=tip,
-            error=e,
-        )
-
     output_file = planned_output_file
-    if codex_status == "ok" and not title and not extracted_title:
-        extracted_from_output = _extract_h1_title(markdown)
-        if extracted_from_output:
-            output_file = triage_output_path(
-                cfg.paths.output_dir.expanduser(),
-                title=extracted_from_output,
+    try:
+        try:
+            result = _run_triage(
+                cfg,
+                link=normalized_url,
+                transcript=payload,
+                metadata=metadata_payload,
+                output_file=planned_output_file,
+            )
+            markdown = result.markdown.strip()
+            codex_status = "ok"
+        except CodexError as e:
+            codex_status, codex_label, tip = _codex_failure_details(e)
+            basis = "Transcript provided" if payload.strip() else "Link only"
+            markdown = _fallback_markdown(
+                title=title_hint,
+                url=normalized_url,
+                basis=basis,
+                transcript_payload=payload,
+                codex_label=codex_label,
+                tip=tip,
+                error=e,
             )
 
-    log.info("Writing analysis to: %s", output_file)
-    atomic_write_text(output_file, markdown)
-    for res in publish_all(cfg, markdown=markdown):
-        if not res.ok:
-            log.warning("Publish failed (%s): %s", res.publisher, res.error)
-        else:
-            log.info("Published (%s): %s", res.publisher, res.url or res.note_id or "ok")
+        if codex_status == "ok" and not title and not extracted_title:
+            extracted_from_output = _extract_h1_title(markdown)
+            if extracted_from_output:
+                # Release the planned name first, so an H1 with the same slug gets it back
+                # instead of a "-2" suffix.
+                planned_output_file.unlink(missing_ok=True)
+                output_file = triage_output_path(
+                    cfg.paths.output_dir.expanduser(),
+                    title=extracted_from_output,
+                )
+
+        log.info("Writing analysis to: %s", output_file)
+        atomic_write_text(output_file, markdown)
+    except BaseException:
+        # Don't leave the reserved (still empty) file behind.
+        output_file.unlink(missing_ok=True)
+        raise
+
+    from wmt.publish import submit_publish_all
+
+    for fut in submit_publish_all(cfg, markdown=markdown):
+        fut.add_done_callback(_log_publish_result)
     state.mark_processed(
         item_id,
         archive_path=None,
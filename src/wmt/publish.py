@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from wmt.config import AppConfig
 from wmt.publishers.base import PublishResult
@@ -8,6 +10,19 @@ from wmt.publishers.hackmd import publish_markdown as publish_hackmd
 
 log = logging.getLogger(__name__)
 
+# Created on first use. concurrent.futures joins its workers at interpreter exit, so one-shot CLI
+# runs still post queued notes before exiting.
+_publish_pool: ThreadPoolExecutor | None = None
+_publish_pool_lock = threading.Lock()
+
+
+def _get_publish_pool() -> ThreadPoolExecutor:
+    global _publish_pool
+    with _publish_pool_lock:
+        if _publish_pool is None:
+            _publish_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wmt-publish")
+        return _publish_pool
+
 
 def publish_all(cfg: AppConfig, *, markdown: str) -> list[PublishResult]:
     results: list[PublishResult] = []
@@ -15,3 +30,12 @@ def publish_all(cfg: AppConfig, *, markdown: str) -> list[PublishResult]:
         results.append(publish_hackmd(cfg.hackmd, markdown=markdown))
     return results
 
+
+def submit_publish_all(cfg: AppConfig, *, markdown: str) -> list[Future[PublishResult]]:
+    """
+    Like `publish_all`, but runs each publisher on a background thread and returns immediately.
+    """
+    futures: list[Future[PublishResult]] = []
+    if cfg.hackmd.enabled:
+        futures.append(_get_publish_pool().submit(publish_hackmd, cfg.hackmd, markdown=markdown))
+    return futures
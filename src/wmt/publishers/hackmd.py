@@ -10,6 +10,11 @@ from urllib.request import Request, urlopen
 from wmt.config import HackMDConfig
 from wmt.publishers.base import PublishResult
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional: faster encoding of large notes
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 
@@ -17,7 +22,7 @@ class HackMDError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HackMDNote:
     note_id: str | None
     url: str | None
@@ -33,6 +38,20 @@ def _extract_note_url(data: dict[str, Any]) -> str | None:
     return None
 
 
+def _json_dumps(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Raw UTF-8 rather than \uXXXX escapes: smaller request bodies for non-ASCII notes.
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    # Both take bytes directly, so there is no separate decode pass; both raise ValueError subclasses.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def create_note(cfg: HackMDConfig, *, content: str) -> HackMDNote:
     if not cfg.api_token:
         raise HackMDError("HackMD api_token is empty")
@@ -41,7 +60,7 @@ def create_note(cfg: HackMDConfig, *, content: str) -> HackMDNote:
 
     url = cfg.api_base_url.rstrip("/") + "/notes"
     payload = {"parentFolderId": cfg.parent_folder_id, "content": content}
-    body = json.dumps(payload).encode("utf-8")
+    body = _json_dumps(payload)
 
     req = Request(
         url,
@@ -57,8 +76,10 @@ def create_note(cfg: HackMDConfig, *, content: str) -> HackMDNote:
     try:
         with urlopen(req, timeout=cfg.timeout_seconds) as resp:
             raw = resp.read()
-            text = raw.decode("utf-8", errors="replace").strip()
-            data = json.loads(text) if text else {}
+            try:
+                data = _json_loads(raw) if raw.strip() else {}
+            except ValueError as e:
+                raise HackMDError(f"HackMD response was not valid JSON: {e}") from e
             if not isinstance(data, dict):
                 raise HackMDError("HackMD response was not a JSON object")
             note_id = data.get("id")
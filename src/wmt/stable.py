@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import os
 import time
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Callable, NamedTuple
 
 
-@dataclass(frozen=True)
-class StatSnapshot:
+class StatSnapshot(NamedTuple):
+    # A tuple rather than a dataclass: it is built and compared for every file on every tick.
     size: int
     mtime_ns: int
 
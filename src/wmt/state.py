@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional: faster ledger serialization
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 
@@ -34,6 +41,10 @@ class StateStore:
     def close(self) -> None:  # pragma: no cover
         raise NotImplementedError
 
+    def reload(self) -> None:  # pragma: no cover
+        """Re-reads the ledger from disk, picking up changes made by other processes."""
+        raise NotImplementedError
+
     def get(self, sha256: str) -> FileRecord | None:  # pragma: no cover
         raise NotImplementedError
 
@@ -86,6 +97,96 @@ class StateStore:
         raise NotImplementedError
 
 
+class ThreadSafeStateStore(StateStore):
+    """
+    Serializes every call to a wrapped store, so worker threads can share one ledger.
+    """
+
+    def __init__(self, inner: StateStore) -> None:
+        self._inner = inner
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._inner.close()
+
+    def reload(self) -> None:
+        with self._lock:
+            self._inner.reload()
+
+    def get(self, sha256: str) -> FileRecord | None:
+        with self._lock:
+            return self._inner.get(sha256)
+
+    def is_processed(self, sha256: str) -> bool:
+        with self._lock:
+            return self._inner.is_processed(sha256)
+
+    def is_source_processed(
+        self,
+        source_path: Path,
+        *,
+        source_mtime_ns: int | None = None,
+        source_size: int | None = None,
+    ) -> bool:
+        with self._lock:
+            return self._inner.is_source_processed(
+                source_path, source_mtime_ns=source_mtime_ns, source_size=source_size
+            )
+
+    def processed_source_snapshots(self) -> dict[str, tuple[int | None, int | None]]:
+        with self._lock:
+            return self._inner.processed_source_snapshots()
+
+    def mark_in_progress(
+        self,
+        sha256: str,
+        source_path: Path,
+        *,
+        source_mtime_ns: int | None,
+        source_size: int | None,
+        force: bool = False,
+    ) -> None:
+        with self._lock:
+            self._inner.mark_in_progress(
+                sha256, source_path, source_mtime_ns=source_mtime_ns, source_size=source_size, force=force
+            )
+
+    def mark_processed(
+        self,
+        sha256: str,
+        *,
+        archive_path: Path | None,
+        topic_file: Path | None,
+        codex_status: str | None,
+        source_path: Path | None = None,
+        source_mtime_ns: int | None = None,
+        source_size: int | None = None,
+    ) -> None:
+        with self._lock:
+            self._inner.mark_processed(
+                sha256,
+                archive_path=archive_path,
+                topic_file=topic_file,
+                codex_status=codex_status,
+                source_path=source_path,
+                source_mtime_ns=source_mtime_ns,
+                source_size=source_size,
+            )
+
+    def mark_failed(self, sha256: str, error: str) -> None:
+        with self._lock:
+            self._inner.mark_failed(sha256, error)
+
+    def allow_retry_in_progress(self, sha256: str, ttl_seconds: int) -> bool:
+        with self._lock:
+            return self._inner.allow_retry_in_progress(sha256, ttl_seconds)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return self._inner.stats()
+
+
 def _infer_backend(backend: str, path: Path) -> str:
     backend = (backend or "").strip().lower()
     if backend and backend != "auto":
@@ -117,15 +218,35 @@ class JsonStateStore(StateStore):
         "records": { "<sha256>": { ...FileRecord fields... } },
         "source_snapshots": { "<source_path>": {"mtime_ns": 123, "size": 456} }
       }
+
+    Updates are appended to `<path>.journal` (one JSON object per line: the full new record, or a
+    source snapshot) instead of rewriting the whole ledger each time. The journal is replayed on
+    open and folded back into the main file on `close()` or every `_COMPACT_EVERY` entries, so
+    between runs the main file is complete and can still be edited by hand.
     """
 
+    _COMPACT_EVERY = 256
+
     def __init__(self, path: Path) -> None:
         self._path = path
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._data = self._load_or_init()
+        self._journal_path = self._path.with_name(self._path.name + ".journal")
+        self.reload()
 
     def close(self) -> None:
-        return
+        if self._journal_entries:
+            self._save()
+
+    def reload(self) -> None:
+        # Every update is appended to the journal as it happens, so nothing in memory is lost by
+        # re-reading both files.
+        self._journal_entries = 0
+        self._data = self._load_or_init()
+        # `_load_or_init` guarantees both maps exist and nothing replaces them until the next
+        # reload, so hold direct references instead of looking them up in `_data` on every call.
+        self._records: dict[str, dict[str, Any]] = self._data["records"]
+        self._source_snapshots: dict[str, dict[str, Any]] = self._data["source_snapshots"]
+        self._replay_journal()
 
     def _load_or_init(self) -> dict[str, Any]:
         if not self._path.exists():
@@ -151,47 +272,87 @@ class JsonStateStore(StateStore):
             data["records"] = {}
         if not isinstance(data["source_snapshots"], dict):
             data["source_snapshots"] = {}
+        # Compact once on load; the mark_* methods never store nulls, so saves can dump as-is.
+        data["records"] = {
+            sha: {k: v for k, v in rec.items() if v is not None}
+            for sha, rec in data["records"].items()
+            if isinstance(rec, dict)
+        }
+        data["source_snapshots"] = {
+            path: compact
+            for path, snap in data["source_snapshots"].items()
+            if isinstance(snap, dict) and (compact := {k: v for k, v in snap.items() if v is not None})
+        }
         return data
 
+    def _replay_journal(self) -> None:
+        try:
+            raw = self._journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        if raw and not raw.endswith(b"\n"):
+            # A torn last line from a crash mid-append; everything before it is intact. Cut it off
+            # now, or the next append would be glued onto it and lost along with it.
+            log.warning("Dropping torn last line of state journal: %s", self._journal_path)
+            raw = raw[: raw.rfind(b"\n") + 1]
+            with self._journal_path.open("r+b") as f:
+                f.truncate(len(raw))
+        for line in raw.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                log.warning("Ignoring unreadable state journal line in: %s", self._journal_path)
+                continue
+            if not isinstance(entry, dict):
+                continue
+            self._journal_entries += 1
+            rec = entry.get("record")
+            if isinstance(entry.get("sha256"), str) and isinstance(rec, dict):
+                self._records[entry["sha256"]] = rec
+            snap = entry.get("snapshot")
+            if isinstance(entry.get("source_path"), str) and isinstance(snap, dict):
+                self._source_snapshots[entry["source_path"]] = snap
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        if orjson is not None:
+            line = orjson.dumps(entry, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = json.dumps(entry, sort_keys=True).encode("utf-8") + b"\n"
+        with self._journal_path.open("a+b") as f:
+            # Never extend a line some other writer left unterminated.
+            if f.seek(0, os.SEEK_END) and (f.seek(-1, os.SEEK_END), f.read(1))[1] != b"\n":
+                line = b"\n" + line
+            f.write(line)
+        self._journal_entries += 1
+        if self._journal_entries >= self._COMPACT_EVERY:
+            self._save()
+
     def _save(self) -> None:
         tmp = self._path.with_suffix(self._path.suffix + ".tmp")
-        text = json.dumps(self._compact_state_for_disk(), indent=2, sort_keys=True)
-        tmp.write_text(text + "\n", encoding="utf-8")
+        state = self._compact_state_for_disk()
+        # Keep the snapshot indented and sorted either way: it is meant to be hand-editable.
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+            tmp.write_bytes(orjson.dumps(state, option=options))
+        else:
+            tmp.write_bytes(json.dumps(state, indent=2, sort_keys=True).encode("utf-8") + b"\n")
         tmp.replace(self._path)
+        # Everything in the journal is now in the main file.
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
 
     def _compact_state_for_disk(self) -> dict[str, Any]:
         """
-        Makes the on-disk JSON less noisy by omitting null keys.
+        Makes the on-disk JSON less noisy by omitting null keys (records are kept compact in
+        memory, see `_load_or_init`) and an empty `source_snapshots`.
         """
-        out: dict[str, Any] = {"version": int(self._data.get("version", 1))}
-
-        records_out: dict[str, Any] = {}
-        for sha, rec in self._records().items():
-            if not isinstance(rec, dict):
-                continue
-            compact = {k: v for k, v in rec.items() if v is not None}
-            records_out[sha] = compact
-        out["records"] = records_out
-
-        source_out: dict[str, Any] = {}
-        for path, snap in self._source_snapshots().items():
-            if not isinstance(snap, dict):
-                continue
-            compact = {k: v for k, v in snap.items() if v is not None}
-            if compact:
-                source_out[path] = compact
-        if source_out:
-            out["source_snapshots"] = source_out
+        out: dict[str, Any] = {"version": int(self._data.get("version", 1)), "records": self._records}
+        if self._source_snapshots:
+            out["source_snapshots"] = self._source_snapshots
         return out
 
-    def _records(self) -> dict[str, dict[str, Any]]:
-        return self._data.setdefault("records", {})
-
-    def _source_snapshots(self) -> dict[str, dict[str, Any]]:
-        return self._data.setdefault("source_snapshots", {})
-
     def get(self, sha256: str) -> FileRecord | None:
-        rec = self._records().get(sha256)
+        rec = self._records.get(sha256)
         if not isinstance(rec, dict):
             return None
         return FileRecord(
@@ -219,7 +380,7 @@ class JsonStateStore(StateStore):
         source_mtime_ns: int | None = None,
         source_size: int | None = None,
     ) -> bool:
-        snap = self._source_snapshots().get(str(source_path))
+        snap = self._source_snapshots.get(str(source_path))
         if not isinstance(snap, dict):
             return False
         mtime_ns = snap.get("mtime_ns")
@@ -232,7 +393,7 @@ class JsonStateStore(StateStore):
 
     def processed_source_snapshots(self) -> dict[str, tuple[int | None, int | None]]:
         out: dict[str, tuple[int | None, int | None]] = {}
-        for path, snap in self._source_snapshots().items():
+        for path, snap in self._source_snapshots.items():
             if not isinstance(snap, dict):
                 continue
             out[path] = (snap.get("mtime_ns"), snap.get("size"))
@@ -247,7 +408,7 @@ class JsonStateStore(StateStore):
         source_size: int | None,
         force: bool = False,
     ) -> None:
-        records = self._records()
+        records = self._records
         if sha256 in records and not force:
             return
         rec = records.get(sha256, {})
@@ -268,7 +429,7 @@ class JsonStateStore(StateStore):
         else:
             rec.pop("source_size", None)
         records[sha256] = rec
-        self._save()
+        self._append({"sha256": sha256, "record": rec})
 
     def mark_processed(
         self,
@@ -281,7 +442,7 @@ class JsonStateStore(StateStore):
         source_mtime_ns: int | None = None,
         source_size: int | None = None,
     ) -> None:
-        records = self._records()
+        records = self._records
         rec = records.get(sha256, {})
         if not isinstance(rec, dict):
             rec = {}
@@ -312,16 +473,15 @@ class JsonStateStore(StateStore):
         else:
             rec.pop("codex_status", None)
         records[sha256] = rec
+        self._append({"sha256": sha256, "record": rec})
 
         if source_path and source_mtime_ns is not None and source_size is not None:
-            self._source_snapshots()[str(source_path)] = {
-                "mtime_ns": int(source_mtime_ns),
-                "size": int(source_size),
-            }
-        self._save()
+            snap = {"mtime_ns": int(source_mtime_ns), "size": int(source_size)}
+            self._source_snapshots[str(source_path)] = snap
+            self._append({"source_path": str(source_path), "snapshot": snap})
 
     def mark_failed(self, sha256: str, error: str) -> None:
-        records = self._records()
+        records = self._records
         rec = records.get(sha256, {})
         if not isinstance(rec, dict):
             rec = {}
@@ -330,7 +490,7 @@ class JsonStateStore(StateStore):
         rec["error"] = error
         rec.pop("started_at", None)
         records[sha256] = rec
-        self._save()
+        self._append({"sha256": sha256, "record": rec})
 
     def allow_retry_in_progress(self, sha256: str, ttl_seconds: int) -> bool:
         rec = self.get(sha256)
@@ -346,7 +506,7 @@ class JsonStateStore(StateStore):
 
     def stats(self) -> dict[str, int]:
         out = {"processed": 0, "failed": 0, "in_progress": 0}
-        for rec in self._records().values():
+        for rec in self._records.values():
             if not isinstance(rec, dict):
                 continue
             status = str(rec.get("status", ""))
@@ -358,14 +518,35 @@ class JsonStateStore(StateStore):
 class SqliteStateStore(StateStore):
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self._db_path)
+        # ":memory:" and "file:" URIs (e.g. "file::memory:?cache=shared") aren't paths on disk.
+        name = str(db_path)
+        is_uri = name.startswith("file:")
+        if not is_uri and name != ":memory:":
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Callers may share the store across threads via ThreadSafeStateStore, which serializes access.
+        # timeout= is SQLite's busy_timeout: the watcher and a one-off `wmt process-one` can
+        # overlap, and a short wait beats failing with "database is locked".
+        self._conn = sqlite3.connect(name, timeout=5.0, check_same_thread=False, uri=is_uri)
         self._conn.row_factory = sqlite3.Row
+        # Every mark_* commits; with WAL + synchronous=NORMAL a commit is an append to the log
+        # rather than a full fsync'd journal round trip, and readers don't block the writer.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_schema()
 
     def close(self) -> None:
+        try:
+            # Cheap when there's nothing to do; keeps planner stats fresh for the source_path indexes.
+            self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            log.debug("PRAGMA optimize failed: %s", e)
         self._conn.close()
 
+    def reload(self) -> None:
+        # Every query reads the database, so other processes' commits are already visible.
+        return
+
     def _init_schema(self) -> None:
         cur = self._conn.cursor()
         cur.execute(
@@ -423,8 +604,9 @@ class SqliteStateStore(StateStore):
         )
 
     def is_processed(self, sha256: str) -> bool:
-        rec = self.get(sha256)
-        return rec is not None and rec.status == "processed"
+        cur = self._conn.cursor()
+        cur.execute("SELECT 1 FROM processed_files WHERE sha256 = ? AND status = 'processed'", (sha256,))
+        return cur.fetchone() is not None
 
     def is_source_processed(
         self,
@@ -459,23 +641,14 @@ class SqliteStateStore(StateStore):
         cur = self._conn.cursor()
         cur.execute(
             """
-            SELECT source_path, source_mtime_ns, source_size, processed_at
+            SELECT source_path, source_mtime_ns, source_size, MAX(COALESCE(processed_at, 0))
             FROM processed_files
-            WHERE status='processed' AND source_path IS NOT NULL
+            WHERE status='processed' AND source_path IS NOT NULL AND source_path != ''
+            GROUP BY source_path
             """
         )
-        latest: dict[str, tuple[float, int | None, int | None]] = {}
-        for row in cur.fetchall():
-            p = row["source_path"]
-            if not p:
-                continue
-            processed_at = float(row["processed_at"] or 0.0)
-            mtime_ns = row["source_mtime_ns"]
-            size = row["source_size"]
-            prev = latest.get(p)
-            if prev is None or processed_at >= prev[0]:
-                latest[p] = (processed_at, mtime_ns, size)
-        return {p: (mtime_ns, size) for p, (_t, mtime_ns, size) in latest.items()}
+        # SQLite takes bare columns from the row that supplied MAX(), i.e. the latest snapshot.
+        return {row["source_path"]: (row["source_mtime_ns"], row["source_size"]) for row in cur.fetchall()}
 
     def mark_in_progress(
         self,
@@ -572,16 +745,18 @@ class SqliteStateStore(StateStore):
         self._conn.commit()
 
     def allow_retry_in_progress(self, sha256: str, ttl_seconds: int) -> bool:
-        rec = self.get(sha256)
-        if rec is None:
+        cur = self._conn.cursor()
+        cur.execute("SELECT status, started_at FROM processed_files WHERE sha256 = ?", (sha256,))
+        row = cur.fetchone()
+        if row is None:
             return True
-        if rec.status == "processed":
+        if row["status"] == "processed":
             return False
-        if rec.status != "in_progress":
+        if row["status"] != "in_progress":
             return True
-        if rec.started_at is None:
+        if row["started_at"] is None:
             return True
-        return (time.time() - rec.started_at) > ttl_seconds
+        return (time.time() - row["started_at"]) > ttl_seconds
 
     def stats(self) -> dict[str, int]:
         cur = self._conn.cursor()
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import os
 import re
-import tempfile
+import threading
 from pathlib import Path
 
 
+_APOS_RE = re.compile(r"['’]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_DASHES_RE = re.compile(r"-{2,}")
+
+
 def _slugify(value: str, *, max_len: int = 80) -> str:
     value = (value or "").strip().lower()
-    value = re.sub(r"['’]", "", value)
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value).strip("-")
+    value = _APOS_RE.sub("", value)
+    value = _NON_ALNUM_RE.sub("-", value)
+    value = _DASHES_RE.sub("-", value).strip("-")
     if not value:
         value = "untitled"
     return value[:max_len].strip("-") or "untitled"
@@ -22,35 +28,52 @@ def triage_output_path(
     slug_max_len: int = 60,
 ) -> Path:
     """
-    Returns a non-existing path under `output_dir`:
+    Reserves and returns a new path under `output_dir`:
       <slug>.md, or <slug>-2.md, <slug>-3.md, ...
 
-    Note: this is best-effort and not perfectly race-proof across concurrent writers, but
-    `wmt` is designed to run as a single writer in normal usage.
+    The file is created empty (O_CREAT|O_EXCL) so the name is claimed before the slow Codex run:
+    concurrent workers or processes with the same slug get different files. Callers replace it
+    with `atomic_write_text`, or unlink it if they give up.
     """
+    output_dir.mkdir(parents=True, exist_ok=True)
     slug = _slugify(title or "", max_len=slug_max_len)
     candidate = output_dir / f"{slug}.md"
-    if not candidate.exists():
+    if _claim(candidate):
         return candidate
 
+    # Collision: list the directory once rather than stat-probing every suffix. Names are compared
+    # lowercased (slugs always are) so case-insensitive filesystems can't hide a clash.
+    with os.scandir(output_dir) as it:
+        taken = {name for entry in it if (name := entry.name.lower()).startswith(slug)}
     for i in range(2, 10_000):
-        candidate = output_dir / f"{slug}-{i}.md"
-        if not candidate.exists():
-            return candidate
+        name = f"{slug}-{i}.md"
+        if name not in taken and _claim(output_dir / name):
+            return output_dir / name
 
     raise RuntimeError(f"Could not find available filename for: {slug}.md")
 
 
-def atomic_write_text(path: Path, text: str) -> None:
+def _claim(path: Path) -> bool:
+    try:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+    except FileExistsError:
+        return False
+    return True
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        delete=False,
-        dir=str(path.parent),
-        prefix=path.name + ".",
-        suffix=".tmp",
-    ) as f:
-        tmp_path = Path(f.name)
-        f.write(text.rstrip("\n") + "\n")
-    tmp_path.replace(path)
+    # Unique per writer (pid + thread), so concurrent pipeline workers never share a temp file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, (text.rstrip("\n") + "\n").encode("utf-8"))
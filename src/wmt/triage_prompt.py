@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
+_SLOT_RE = re.compile(r"\{(LINK|TRANSCRIPT|METADATA|OUTPUT_FILE)\}")
 
+
+@lru_cache(maxsize=1)  # ships with the package, so it can't change under a running process
 def _load_packaged_prompt_template() -> str:
     return (
         resources.files("wmt")
@@ -17,10 +22,12 @@ def _load_prompt_template(prompt_file: Path | None) -> str:
     if prompt_file is None:
         return _load_packaged_prompt_template()
 
+    # Not cached: a user prompt file may be edited while the watcher is running.
     path = Path(prompt_file).expanduser()
-    if not path.exists():
-        raise FileNotFoundError(f"Triage prompt file not found: {path}")
-    return path.read_text(encoding="utf-8").strip()
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Triage prompt file not found: {path}") from None
 
 def build_triage_prompt(
     *,
@@ -32,9 +39,17 @@ def build_triage_prompt(
 ) -> str:
     # Important: only fill the *input value slots* (first occurrence), leaving later references
     # like "If {TRANSCRIPT} is present..." intact as variable names (not duplicated transcript text).
-    prompt = _load_prompt_template(prompt_file)
-    prompt = prompt.replace("{LINK}", link or "", 1)
-    prompt = prompt.replace("{TRANSCRIPT}", transcript or "", 1)
-    prompt = prompt.replace("{METADATA}", metadata or "", 1)
-    prompt = prompt.replace("{OUTPUT_FILE}", output_file or "", 1)
-    return prompt
+    values = {
+        "LINK": link or "",
+        "TRANSCRIPT": transcript or "",
+        "METADATA": metadata or "",
+        "OUTPUT_FILE": output_file or "",
+    }
+
+    def fill(m: re.Match[str]) -> str:
+        # pop: each slot is filled once, later matches stay as-is.
+        return values.pop(m.group(1), m.group(0))
+
+    # One pass over the template, so the (potentially large) transcript is never rescanned and
+    # slot-like text inside the inserted values is left alone.
+    return _SLOT_RE.sub(fill, _load_prompt_template(prompt_file))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
 from typing import Iterable
-from urllib.parse import parse_qsl, urlsplit, urlunsplit
+from urllib.parse import SplitResult, parse_qsl, urlsplit, urlunsplit
 
 
-_DROP_QUERY_KEYS = {
+_DROP_QUERY_KEYS = frozenset({
     # Common analytics / trackers
     "gclid",
     "fbclid",
@@ -20,7 +20,7 @@ _DROP_QUERY_KEYS = {
     "ref",
     "ref_src",
     "spm",
-}
+})
 
 
 def is_probably_http_url(url: str) -> bool:
@@ -33,32 +33,25 @@ def _drop_tracking_params(pairs: Iterable[tuple[str, str]]) -> list[tuple[str, s
     for k, v in pairs:
         key = k.strip()
         lowered = key.lower()
-        if not lowered:
-            continue
-        if lowered.startswith("utm_"):
-            continue
-        if lowered in _DROP_QUERY_KEYS:
+        # `utm_*` is open-ended, so it stays a prefix check rather than joining the set.
+        if not lowered or lowered in _DROP_QUERY_KEYS or lowered.startswith("utm_"):
             continue
         out.append((key, v))
     return out
 
 
-_YOUTUBE_HOST_RE = re.compile(r"(^|\.)youtube\.com$", re.IGNORECASE)
-
-
 def _is_youtube_host(host: str) -> bool:
     host = (host or "").strip().lower()
-    return host == "youtu.be" or bool(_YOUTUBE_HOST_RE.search(host))
+    return host in ("youtu.be", "youtube.com") or host.endswith(".youtube.com")
 
 
-def _canonicalize_youtube(url: str) -> str | None:
+def _canonicalize_youtube(parts: SplitResult) -> str | None:
     """
     Produces a stable canonical URL for YouTube videos:
       https://www.youtube.com/watch?v=<VIDEO_ID>
 
     Drops time/playlist/etc so duplicates collapse.
     """
-    parts = urlsplit(url.strip())
     host = (parts.hostname or "").lower()
     if not _is_youtube_host(host):
         return None
@@ -70,26 +63,30 @@ def _canonicalize_youtube(url: str) -> str | None:
             video_id = path.split("/")[0]
     else:
         if parts.path.rstrip("/") == "/watch":
-            qs = dict(parse_qsl(parts.query, keep_blank_values=True))
-            video_id = qs.get("v") or None
+            for key, value in parse_qsl(parts.query, keep_blank_values=True):
+                if key == "v":
+                    video_id = value or None  # last one wins, as with dict(parse_qsl(...))
         elif parts.path.startswith("/shorts/"):
-            video_id = parts.path.split("/")[2] if len(parts.path.split("/")) > 2 else None
+            video_id = parts.path.split("/", 3)[2]
 
     if not video_id:
         return None
     return f"https://www.youtube.com/watch?v={video_id}"
 
 
+# The watcher re-walks the same Inbox bookmarks on every stable poll, so most calls are repeats.
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     url = (url or "").strip()
     if not url:
         return ""
 
-    yt = _canonicalize_youtube(url)
+    # Split once and share it with the YouTube check instead of parsing the URL twice.
+    parts = urlsplit(url)
+    yt = _canonicalize_youtube(parts)
     if yt:
         return yt
 
-    parts = urlsplit(url)
     scheme = parts.scheme.lower()
     netloc = parts.netloc
 
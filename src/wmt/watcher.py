@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
 import signal
+import threading
 import time
+from pathlib import Path
+from typing import Any, Iterator
 
 from wmt.config import AppConfig
-from wmt.pipeline import process_one_from_inbox
-from wmt.state import StateStore, open_state_store
+from wmt.pipeline import process_inbox
+from wmt.state import SqliteStateStore, StateStore, open_state_store
 from wmt.stable import StableFileTracker
 
 log = logging.getLogger(__name__)
@@ -15,26 +19,107 @@ log = logging.getLogger(__name__)
 class Watcher:
     def __init__(self, cfg: AppConfig) -> None:
         self._cfg = cfg
-        self._stop = False
+        self._stop_event = threading.Event()
         self._stable = StableFileTracker(stable_seconds=cfg.processing.stable_seconds)
+        self._state: StateStore | None = None
+        self._state_signature: tuple[tuple[int, int] | None, ...] = ()
 
     def close(self) -> None:
-        return
+        if self._state is not None:
+            self._state.close()
+            self._state = None
 
     def stop(self) -> None:
-        self._stop = True
+        self._stop_event.set()
 
     def run_forever(self) -> None:
         signal.signal(signal.SIGTERM, lambda *_: self.stop())
         signal.signal(signal.SIGINT, lambda *_: self.stop())
 
         log.info("Watching bookmarks file: %s", self._cfg.paths.bookmarks_file)
-        while not self._stop:
-            self.run_once(log_when_idle=False, wait_for_stable=True)
-            time.sleep(self._cfg.processing.poll_interval_seconds)
+        if self._cfg.processing.force_polling or not self._run_with_notifications():
+            self._run_polling()
 
         log.info("Watcher stopped")
 
+    def _run_polling(self) -> None:
+        while not self._stop_event.is_set():
+            self.run_once(log_when_idle=False, wait_for_stable=True)
+            self._stop_event.wait(self._cfg.processing.poll_interval_seconds)
+
+    def _watchfiles(self) -> Any | None:
+        """The optional `watchfiles` module, or None if unavailable or polling is forced."""
+        if self._cfg.processing.force_polling:
+            return None
+        try:
+            import watchfiles  # type: ignore[import-not-found]
+        except ImportError:
+            return None
+        if not self._cfg.paths.bookmarks_file.parent.is_dir():
+            return None
+        return watchfiles
+
+    def _watch_bookmarks(self, watchfiles: Any, *, timeout_ms: int, **kwargs: Any) -> Iterator[set[Any]]:
+        # Watch the directory, not the file: browsers replace Bookmarks via rename, which would
+        # orphan a watch on the old inode.
+        name = self._cfg.paths.bookmarks_file.name
+        return watchfiles.watch(
+            self._cfg.paths.bookmarks_file.parent,
+            watch_filter=lambda _change, path: Path(path).name == name,
+            stop_event=self._stop_event,
+            rust_timeout=timeout_ms,
+            yield_on_timeout=True,
+            recursive=False,
+            **kwargs,
+        )
+
+    def _run_with_notifications(self) -> bool:
+        """
+        Runs until stopped, waking on filesystem events for the bookmarks file (inotify/FSEvents
+        via the optional `watchfiles` package) instead of sleeping a full poll interval.
+
+        Returns False if `watchfiles` isn't installed, can't watch the bookmarks directory, or the
+        watch fails later on, so the caller can fall back to polling.
+        """
+        watchfiles = self._watchfiles()
+        if watchfiles is None:
+            log.debug("Not using filesystem notifications; polling every %ss", self._cfg.processing.poll_interval_seconds)
+            return False
+
+        # Still wake every poll interval: a run handles at most max_items_per_run bookmarks, so
+        # leftovers must be picked up even if the file doesn't change again.
+        changes = self._watch_bookmarks(watchfiles, timeout_ms=self._cfg.processing.poll_interval_seconds * 1000)
+        self.run_once(log_when_idle=False, wait_for_stable=True)
+        while not self._stop_event.is_set():
+            # Only the watch itself is guarded: errors from a run propagate as they do when polling.
+            try:
+                next(changes)
+            except StopIteration:
+                break
+            except (OSError, RuntimeError) as e:
+                # e.g. the inotify watch limit was reached.
+                log.warning("Filesystem notifications failed (%s); falling back to polling", e)
+                return False
+            if self._stop_event.is_set():
+                break
+            self.run_once(log_when_idle=False, wait_for_stable=True)
+        return True
+
+    def _wait_for_change(self, timeout: float) -> None:
+        """
+        Waits up to `timeout` seconds, returning early if the bookmarks file changes (when
+        `watchfiles` is available) or the watcher is stopped. Without notifications it polls.
+        """
+        watchfiles = self._watchfiles()
+        if watchfiles is not None:
+            try:
+                # Short debounce: any change means "not stable yet", so report it promptly.
+                for _ in self._watch_bookmarks(watchfiles, timeout_ms=max(1, int(timeout * 1000)), debounce=100):
+                    return
+            except (OSError, RuntimeError) as e:
+                log.debug("Filesystem notifications failed (%s); polling instead", e)
+        self._stop_event.wait(min(0.5, timeout))
+
     def run_once(
         self,
         *,
@@ -45,17 +130,18 @@ class Watcher:
         if log_when_idle:
             log.info("Checking bookmarks file: %s", bookmarks_path)
 
-        if not bookmarks_path.exists():
+        # `observe` already stats the file (and skips it if missing), so only pay for a separate
+        # existence check when it didn't come back stable.
+        stable = self._stable.observe([bookmarks_path])
+        if not stable and not bookmarks_path.exists():
             if log_when_idle:
                 log.warning("Bookmarks file does not exist: %s", bookmarks_path)
             return
 
-        stable = self._stable.observe([bookmarks_path])
         if not stable and wait_for_stable and self._cfg.processing.stable_seconds > 0:
             deadline = time.monotonic() + float(self._cfg.processing.stable_seconds)
-            while not stable and time.monotonic() < deadline and not self._stop:
-                remaining = deadline - time.monotonic()
-                time.sleep(min(0.5, max(0.0, remaining)))
+            while not stable and time.monotonic() < deadline and not self._stop_event.is_set():
+                self._wait_for_change(max(0.0, deadline - time.monotonic()))
                 stable = self._stable.observe([bookmarks_path])
 
         if not stable:
@@ -66,16 +152,52 @@ class Watcher:
                 )
             return
 
-        # Reload the state store each run so manual edits to state.json take effect, and so
-        # concurrent one-off runs (`wmt process-one`) don't require restarting the watcher.
-        state: StateStore = open_state_store(path=self._cfg.state.path, backend=self._cfg.state.backend)
+        state = self._open_state()
         try:
-            outcome = process_one_from_inbox(self._cfg, state=state)
-            if outcome:
+            for outcome in process_inbox(self._cfg, state=state):
                 log.info(
                     "Processed bookmark -> %s (codex=%s)",
                     outcome.output_file,
                     outcome.codex_status,
                 )
         finally:
-            state.close()
+            if self._read_state_signature() != self._state_signature:
+                # This run wrote to the ledger: close to fold the journal back into the main file,
+                # so state.json stays complete (and hand-editable) while the watcher sits idle.
+                self.close()
+
+    def _state_files(self) -> tuple[Path, ...]:
+        path = self._cfg.state.path.expanduser()
+        # Where each backend's writes land first: SQLite's write-ahead log (the main file only
+        # changes on checkpoint), or the JSON store's journal.
+        suffix = "-wal" if isinstance(self._state, SqliteStateStore) else ".journal"
+        return (path, path.with_name(path.name + suffix))
+
+    def _read_state_signature(self) -> tuple[tuple[int, int] | None, ...]:
+        signature: list[tuple[int, int] | None] = []
+        for path in self._state_files():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _open_state(self) -> StateStore:
+        """
+        The state store for this run. It is kept open between runs that don't write to it, so an
+        idle tick costs a couple of stats rather than a re-parse of the ledger; if the files
+        changed meanwhile (a manual edit to state.json, or a concurrent `wmt process-one`) the
+        store is reloaded first.
+        """
+        if self._state is None:
+            self._state = open_state_store(path=self._cfg.state.path, backend=self._cfg.state.backend)
+            # Opening may create files (sqlite), and which files to watch depends on the backend.
+            self._state_signature = self._read_state_signature()
+            return self._state
+        signature = self._read_state_signature()
+        if signature != self._state_signature:
+            self._state.reload()
+            self._state_signature = signature
+        return self._state
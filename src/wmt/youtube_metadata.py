@@ -3,13 +3,14 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 from urllib.parse import urlencode
 
 from wmt.fetch import fetch_url
-from wmt.youtube_transcripts import is_youtube_url
+from wmt.youtube_transcripts import is_youtube_url, youtube_video_id
+from wmt.youtube_ytdlp import extract_info, yt_dlp_base_cmd
 
 log = logging.getLogger(__name__)
 
@@ -31,10 +32,10 @@ def _parse_upload_date(value: str | None) -> str | None:
         return None
     # yt-dlp uses YYYYMMDD.
     if len(v) == 8 and v.isdigit():
+        # Slicing + `date` is much cheaper than `strptime`, and still rejects e.g. Feb 31.
         try:
-            dt = datetime.strptime(v, "%Y%m%d")
-            return dt.strftime("%Y-%m-%d")
-        except Exception:
+            return date(int(v[:4]), int(v[4:6]), int(v[6:8])).isoformat()
+        except ValueError:
             return None
     return None
 
@@ -54,24 +55,35 @@ def _try_oembed(url: str, *, timeout_seconds: int) -> tuple[dict[str, object] |
     return data, None
 
 
+def _try_yt_dlp_library(url: str, *, timeout_seconds: int) -> tuple[dict[str, object] | None, str | None]:
+    video_id = youtube_video_id(url)
+    if not video_id:
+        return None, "no YouTube video id"
+    try:
+        # Same overall limit as the CLI path below.
+        info = extract_info(video_id, socket_timeout=timeout_seconds, deadline_seconds=max(5, timeout_seconds))
+        return info, None
+    except ImportError:
+        raise
+    except TimeoutError:
+        return None, "yt-dlp timed out"
+    except Exception as e:
+        return None, f"yt-dlp failed: {e}"
+
+
 def _try_yt_dlp_json(url: str, *, timeout_seconds: int) -> tuple[dict[str, object] | None, str | None]:
-    candidates: list[list[str]] = [
-        [sys.executable, "-m", "yt_dlp"],
-        ["yt-dlp"],
-    ]
-    base: list[str] | None = None
-    for c in candidates:
-        try:
-            subprocess.run(c + ["--version"], capture_output=True, text=True, check=True)
-            base = c
-            break
-        except Exception:
-            continue
+    # In-process when the package is importable; otherwise shell out (e.g. a standalone binary).
+    try:
+        return _try_yt_dlp_library(url, timeout_seconds=timeout_seconds)
+    except ImportError:
+        pass
 
+    base = yt_dlp_base_cmd()
     if base is None:
         return None, "yt-dlp not installed"
 
-    cmd = base + [
+    cmd = [
+        *base,
         "--dump-json",
         "--skip-download",
         "--no-warnings",
@@ -124,7 +136,12 @@ def get_youtube_metadata(url: str, *, timeout_seconds: int = 20) -> YouTubeMetad
     duration_seconds: int | None = None
     sources: list[str] = []
 
-    oembed, oembed_err = _try_oembed(url, timeout_seconds=timeout_seconds)
+    # Independent lookups: run yt-dlp (the slow one) alongside the oEmbed request.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ytdlp_future = pool.submit(_try_yt_dlp_json, url, timeout_seconds=timeout_seconds)
+        oembed, oembed_err = _try_oembed(url, timeout_seconds=timeout_seconds)
+        ytdlp, ytdlp_err = ytdlp_future.result()
+
     if oembed:
         sources.append("oembed")
         title = str(oembed.get("title") or "").strip() or title
@@ -133,7 +150,6 @@ def get_youtube_metadata(url: str, *, timeout_seconds: int = 20) -> YouTubeMetad
     elif oembed_err:
         notes.append(f"oEmbed unavailable: {oembed_err}")
 
-    ytdlp, ytdlp_err = _try_yt_dlp_json(url, timeout_seconds=timeout_seconds)
     if ytdlp:
         sources.append("yt-dlp")
         title = str(ytdlp.get("title") or "").strip() or title
@@ -157,7 +173,8 @@ def get_youtube_metadata(url: str, *, timeout_seconds: int = 20) -> YouTubeMetad
         notes.append(ytdlp_err)
 
     if not any([title, channel, channel_url, upload_date, duration_seconds]):
-        log.info("YouTube metadata unavailable for %s (%s)", url, "; ".join(notes) if notes else "no details")
+        if log.isEnabledFor(logging.INFO):
+            log.info("YouTube metadata unavailable for %s (%s)", url, "; ".join(notes) if notes else "no details")
         return None
 
     meta = YouTubeMetadata(
@@ -169,10 +186,12 @@ def get_youtube_metadata(url: str, *, timeout_seconds: int = 20) -> YouTubeMetad
         source="+".join(sources) if sources else "unknown",
         notes=tuple(notes),
     )
-    log.info(
-        "Retrieved YouTube metadata via %s (title=%s, channel=%s)",
-        meta.source,
-        (meta.title or "").strip()[:80] or "unknown",
-        (meta.channel or "").strip()[:80] or "unknown",
-    )
+    # The summary arguments are built eagerly, so skip them when INFO is filtered out.
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Retrieved YouTube metadata via %s (title=%s, channel=%s)",
+            meta.source,
+            (meta.title or "").strip()[:80] or "unknown",
+            (meta.channel or "").strip()[:80] or "unknown",
+        )
     return meta
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-import importlib.metadata
+import functools
 import logging
 import subprocess
-import sys
 import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlsplit
 
+from wmt.youtube_ytdlp import extract_info, read_url, yt_dlp_base_cmd
+
 log = logging.getLogger(__name__)
 
+# Overall cap on a yt-dlp subtitle lookup (info extraction + track download), CLI or library.
+_YT_DLP_SUBTITLE_TIMEOUT_SECONDS = 120
+
 
 class YouTubeTranscriptError(RuntimeError):
     pass
@@ -26,20 +31,27 @@ class YouTubeTranscript:
     notes: tuple[str, ...] = ()
 
 
+_YOUTUBE_HOSTS = frozenset({"youtu.be", "youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"})
+
+
+def _is_youtube_host(host: str) -> bool:
+    # `hostname` is already lowercased by urlsplit; the set covers nearly every real URL.
+    return host in _YOUTUBE_HOSTS or host.endswith(".youtube.com")
+
+
 def is_youtube_url(url: str) -> bool:
-    host = (urlsplit(url).hostname or "").lower()
-    return host == "youtu.be" or host.endswith(".youtube.com") or host == "youtube.com"
+    return _is_youtube_host(urlsplit(url).hostname or "")
 
 
 def youtube_video_id(url: str) -> str | None:
     parts = urlsplit(url)
-    host = (parts.hostname or "").lower()
+    host = parts.hostname or ""
 
     if host == "youtu.be":
         path = parts.path.strip("/")
         return path.split("/")[0] if path else None
 
-    if host.endswith("youtube.com") or host == "youtube.com":
+    if _is_youtube_host(host):
         if parts.path.rstrip("/") == "/watch":
             qs = parse_qs(parts.query)
             v = qs.get("v")
@@ -57,41 +69,47 @@ def _vtt_to_text(vtt: str) -> str:
     """
     Very small WebVTT parser: keeps timestamps and text.
     """
+    # Runs once per caption line (tens of thousands for long auto-captioned videos), so keep the
+    # common text-line path to a strip and a few cheap checks. splitlines() handles \r\n and \r.
     out: list[str] = []
-    for line in vtt.replace("\r\n", "\n").replace("\r", "\n").splitlines():
+    append = out.append
+    for line in vtt.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
-        if stripped.upper().startswith("WEBVTT"):
-            continue
         if "-->" in stripped:
             # Timestamp cue line.
-            out.append(f"[{stripped}]")
-            continue
-        if stripped.startswith("NOTE"):
+            if stripped[:6].upper() != "WEBVTT":
+                append(f"[{stripped}]")
             continue
-        if stripped.isdigit():
+        if stripped.isdigit() or stripped.startswith("NOTE") or stripped[:6].upper() == "WEBVTT":
             continue
-        out.append(stripped)
-    text = "\n".join(out).strip()
-    return text
+        append(stripped)
+    return "\n".join(out).strip()
 
 
 def _srt_to_text(srt: str) -> str:
     out: list[str] = []
-    for line in srt.replace("\r\n", "\n").replace("\r", "\n").splitlines():
+    append = out.append
+    for line in srt.splitlines():
         stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.isdigit():
+        if not stripped or stripped.isdigit():
             continue
-        if "-->" in stripped:
-            out.append(f"[{stripped}]")
-            continue
-        out.append(stripped)
+        append(f"[{stripped}]" if "-->" in stripped else stripped)
     return "\n".join(out).strip()
 
 
+@functools.lru_cache(maxsize=1)
+def _transcript_api(api_cls: Any) -> Any:
+    """
+    One API object per process: v1+ instances own a `requests.Session`, so reusing the instance
+    keeps the connection to YouTube alive between videos instead of a new TLS handshake each time.
+    """
+    if hasattr(api_cls, "__call__") or isinstance(api_cls, type):
+        return api_cls()
+    return api_cls
+
+
 def _try_youtube_transcript_api(video_id: str) -> YouTubeTranscript | None:
     try:
         from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore[import-not-found]
@@ -106,10 +124,7 @@ def _try_youtube_transcript_api(video_id: str) -> YouTubeTranscript | None:
     try:
         # youtube-transcript-api v1+ uses an instance API with `fetch()` returning a FetchedTranscript.
         # Older versions used classmethods like `get_transcript` / `list_transcripts`.
-        if hasattr(YouTubeTranscriptApi, "__call__") or isinstance(YouTubeTranscriptApi, type):
-            api = YouTubeTranscriptApi()  # type: ignore[call-arg]
-        else:
-            api = YouTubeTranscriptApi  # type: ignore[assignment]
+        api = _transcript_api(YouTubeTranscriptApi)
 
         # v1+: api.fetch(video_id, languages=[...]) -> iterable of snippets with .text/.start
         if hasattr(api, "fetch"):
@@ -153,6 +168,8 @@ def _try_youtube_transcript_api(video_id: str) -> YouTubeTranscript | None:
         )
     except Exception as e:
         try:
+            import importlib.metadata
+
             ver = importlib.metadata.version("youtube-transcript-api")
         except Exception:
             ver = "unknown"
@@ -167,49 +184,93 @@ def _try_youtube_transcript_api(video_id: str) -> YouTubeTranscript | None:
 
 
 def _pick_sub_file(files: list[Path]) -> Path | None:
-    if not files:
-        return None
-
     def score(p: Path) -> tuple[int, int]:
         name = p.name.lower()
         is_auto = 1 if "auto" in name else 0
         is_en = 0 if ".en" in name else 1
         return (is_auto, is_en)
 
-    files.sort(key=score)
-    return files[0]
+    # min() keeps the first of equally-scored files, as the stable sort it replaces did.
+    return min(files, key=score, default=None)
+
+
+def _pick_requested_sub(info: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    requested = info.get("requested_subtitles") or {}
+    manual = info.get("subtitles") or {}
+    usable = [
+        (lang, sub)
+        for lang, sub in requested.items()
+        if isinstance(sub, dict) and sub.get("ext") in ("vtt", "srt") and (sub.get("data") or sub.get("url"))
+    ]
+    # Same preference as `_pick_sub_file`: manual before auto, English before anything else.
+    return min(usable, key=lambda item: (item[0] not in manual, not item[0].lower().startswith("en")), default=None)
 
 
-def _yt_dlp_base_cmd() -> list[str] | None:
+def _try_yt_dlp_library(video_id: str, *, timeout_seconds: int) -> YouTubeTranscript | None:
     """
-    Prefer `python -m yt_dlp` so a pip-installed package works without Homebrew/system installs.
-    Fall back to `yt-dlp` if available.
+    `_try_yt_dlp`, but with yt-dlp imported in-process: no interpreter startup per video, the
+    info dict is shared with the metadata lookup, and the subtitle track is read straight into
+    memory instead of via a temp directory.
     """
-    candidates: list[list[str]] = [
-        [sys.executable, "-m", "yt_dlp"],
-        ["yt-dlp"],
-    ]
-    for base in candidates:
+    log.info("Fetching YouTube subtitles via yt-dlp")
+    deadline = time.monotonic() + _YT_DLP_SUBTITLE_TIMEOUT_SECONDS
+    try:
+        info = extract_info(
+            video_id, socket_timeout=timeout_seconds, deadline_seconds=_YT_DLP_SUBTITLE_TIMEOUT_SECONDS
+        )
+    except ImportError:
+        raise
+    except Exception as e:
+        log.info("yt-dlp failed: %s", e)
+        return None
+
+    picked = _pick_requested_sub(info)
+    if picked is None:
+        return None
+    lang, sub = picked
+    raw = sub.get("data")
+    if raw is None:
         try:
-            subprocess.run(base + ["--version"], capture_output=True, text=True, check=True)
-            return base
-        except Exception:
-            continue
-    return None
+            remaining = max(1.0, deadline - time.monotonic())
+            raw = read_url(sub["url"], socket_timeout=timeout_seconds, deadline_seconds=remaining)
+            raw = raw.decode("utf-8", errors="replace")
+        except Exception as e:
+            log.info("yt-dlp failed to fetch subtitles: %s", e)
+            return None
+
+    text = _vtt_to_text(raw) if sub.get("ext") == "vtt" else _srt_to_text(raw)
+    if not text.strip():
+        return None
+    return YouTubeTranscript(
+        text=text.strip(),
+        source="yt-dlp",
+        language=lang,
+        is_auto=lang not in (info.get("subtitles") or {}),
+    )
 
 
-def _try_yt_dlp(url: str) -> YouTubeTranscript | None:
+def _try_yt_dlp(url: str, *, timeout_seconds: int) -> YouTubeTranscript | None:
     """
     Uses `yt-dlp` if installed to fetch subtitles (manual or auto) and convert to text.
+
+    Runs it as a library when importable; the subprocess path covers a standalone `yt-dlp` binary.
     """
-    base = _yt_dlp_base_cmd()
+    video_id = youtube_video_id(url)
+    if video_id:
+        try:
+            return _try_yt_dlp_library(video_id, timeout_seconds=timeout_seconds)
+        except ImportError:
+            pass
+
+    base = yt_dlp_base_cmd()
     if not base:
         return None
 
     with tempfile.TemporaryDirectory(prefix="wmt_yt_") as td:
         tmp = Path(td)
         out_tmpl = str(tmp / "%(id)s.%(ext)s")
-        cmd = base + [
+        cmd = [
+            *base,
             "--skip-download",
             "--no-warnings",
             "--write-subs",
@@ -224,7 +285,7 @@ def _try_yt_dlp(url: str) -> YouTubeTranscript | None:
         ]
         log.info("Fetching YouTube subtitles via yt-dlp")
         try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=120)
+            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=_YT_DLP_SUBTITLE_TIMEOUT_SECONDS)
         except subprocess.TimeoutExpired:
             log.info("yt-dlp timed out fetching subtitles")
             return None
@@ -265,7 +326,13 @@ def _try_yt_dlp(url: str) -> YouTubeTranscript | None:
         )
 
 
-def get_youtube_transcript(url: str) -> YouTubeTranscript | None:
+def get_youtube_transcript(url: str, *, timeout_seconds: int = 20) -> YouTubeTranscript | None:
+    """
+    Transcript via youtube-transcript-api, falling back to yt-dlp subtitles.
+
+    `timeout_seconds` is yt-dlp's per-request socket timeout; the whole subtitle lookup is capped
+    at two minutes either way.
+    """
     video_id = youtube_video_id(url)
     if not video_id:
         return None
@@ -274,7 +341,7 @@ def get_youtube_transcript(url: str) -> YouTubeTranscript | None:
     if from_api and from_api.text.strip():
         return from_api
 
-    from_ytdlp = _try_yt_dlp(url)
+    from_ytdlp = _try_yt_dlp(url, timeout_seconds=timeout_seconds)
     if from_ytdlp and from_ytdlp.text.strip():
         return from_ytdlp
 
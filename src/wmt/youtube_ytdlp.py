@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import logging
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# One lookup serves both metadata and transcripts, so always ask for English subtitle tracks.
+SUBTITLE_LANGS = ["en.*", "en"]
+
+# Long enough for one bookmark's metadata and transcript lookups; well inside the lifetime of the
+# signed subtitle URLs in `requested_subtitles`.
+_INFO_TTL_SECONDS = 120.0
+# What `youtube_metadata` and `youtube_transcripts` read; the rest of an info dict (formats,
+# thumbnails, ...) is large and unused.
+_INFO_KEYS = (
+    "title",
+    "uploader",
+    "channel",
+    "uploader_url",
+    "channel_url",
+    "duration",
+    "upload_date",
+    "requested_subtitles",
+)
+
+_info_lock = threading.Lock()
+_info_memo: dict[tuple[str, float], tuple[dict[str, Any], float]] = {}
+
+
+class _YtDlpLogger:
+    """Sends in-process yt-dlp console output to our debug log instead of stdout/stderr."""
+
+    def debug(self, msg: str) -> None:
+        log.debug("yt-dlp: %s", msg)
+
+    info = warning = error = debug
+
+
+def yt_dlp_options(**overrides: Any) -> dict[str, Any]:
+    """`YoutubeDL` params shared by the in-process (library) yt-dlp calls; never downloads media."""
+    return {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "noplaylist": True,
+        "logger": _YtDlpLogger(),
+        **overrides,
+    }
+
+
+def _run_with_deadline(fn: Callable[..., _T], *args: Any, deadline_seconds: float) -> _T:
+    """
+    Runs `fn(*args)` on a daemon thread and waits at most `deadline_seconds` for it.
+
+    yt-dlp's socket timeout only bounds each request and an extraction makes many, so this is the
+    overall limit (what `subprocess.run(timeout=...)` gave the CLI path). A call that overruns is
+    abandoned, not killed; being a daemon thread it can't hold up interpreter exit.
+    """
+    future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="wmt-yt-dlp", daemon=True).start()
+    try:
+        return future.result(timeout=deadline_seconds)
+    except concurrent.futures.TimeoutError:
+        raise TimeoutError(f"yt-dlp timed out after {deadline_seconds:g}s") from None
+
+
+def extract_info(video_id: str, *, socket_timeout: float, deadline_seconds: float) -> dict[str, Any]:
+    """
+    yt-dlp's info dict for a video (including `requested_subtitles`), via the library.
+
+    Trimmed to the fields wmt reads (`subtitles` keeps only its language keys) and memoized for
+    `_INFO_TTL_SECONDS`, so the metadata and transcript lookups for one bookmark share a single
+    extraction without later runs seeing stale metadata or expired signed subtitle URLs. Results
+    without subtitles and failures aren't memoized. The dict is shared: callers must not modify it.
+
+    Raises ImportError if yt-dlp isn't importable (callers fall back to the CLI), TimeoutError
+    after `deadline_seconds`, or whatever yt-dlp raises if extraction fails.
+    """
+    key = (video_id, socket_timeout)
+    now = time.monotonic()
+    with _info_lock:
+        hit = _info_memo.get(key)
+        if hit is not None and now - hit[1] < _INFO_TTL_SECONDS:
+            return hit[0]
+    info = _run_with_deadline(_extract_info, video_id, socket_timeout, deadline_seconds=deadline_seconds)
+    if info.get("requested_subtitles"):
+        with _info_lock:
+            now = time.monotonic()
+            for k in [k for k, (_, at) in _info_memo.items() if now - at >= _INFO_TTL_SECONDS]:
+                del _info_memo[k]
+            _info_memo[key] = (info, now)
+    return info
+
+
+def _extract_info(video_id: str, socket_timeout: float) -> dict[str, Any]:
+    import yt_dlp  # type: ignore[import-not-found]
+
+    opts = yt_dlp_options(
+        writesubtitles=True,
+        writeautomaticsub=True,
+        subtitleslangs=SUBTITLE_LANGS,
+        subtitlesformat="vtt/srt",
+        socket_timeout=socket_timeout,
+    )
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+    if not isinstance(info, dict):
+        raise ValueError("unexpected yt-dlp payload")
+    slim = {k: info[k] for k in _INFO_KEYS if k in info}
+    slim["subtitles"] = dict.fromkeys(info.get("subtitles") or ())
+    return slim
+
+
+def read_url(url: str, *, socket_timeout: float, deadline_seconds: float) -> bytes:
+    """Fetches a URL (e.g. a subtitle track from `extract_info`) through yt-dlp's HTTP stack."""
+    return _run_with_deadline(_read_url, url, socket_timeout, deadline_seconds=deadline_seconds)
+
+
+def _read_url(url: str, socket_timeout: float) -> bytes:
+    import yt_dlp  # type: ignore[import-not-found]
+
+    with yt_dlp.YoutubeDL(yt_dlp_options(socket_timeout=socket_timeout)) as ydl:
+        return ydl.urlopen(url).read()
+
+
+@functools.lru_cache(maxsize=1)
+def yt_dlp_base_cmd() -> tuple[str, ...] | None:
+    """
+    Prefer `python -m yt_dlp` so a pip-installed package works without Homebrew/system installs.
+    Fall back to `yt-dlp` if available.
+
+    Probed once per process (each probe is a fork+exec of `--version`).
+    """
+    candidates: list[list[str]] = [
+        [sys.executable, "-m", "yt_dlp"],
+        ["yt-dlp"],
+    ]
+    for base in candidates:
+        try:
+            subprocess.run(base + ["--version"], capture_output=True, text=True, check=True)
+            return tuple(base)
+        except Exception:
+            continue
+    return None
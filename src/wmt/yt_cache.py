@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from wmt.triage_output import atomic_write_text
+from wmt.youtube_metadata import YouTubeMetadata, get_youtube_metadata
+from wmt.youtube_transcripts import YouTubeTranscript, get_youtube_transcript, youtube_video_id
+
+log = logging.getLogger(__name__)
+
+# Titles/channels occasionally change; captions for a given video effectively don't.
+METADATA_TTL_SECONDS = 7 * 24 * 3600
+
+_VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+_MEMO_MAX_ENTRIES = 256
+# (kind, video id) -> (value, cached_at); cached_at is when it was fetched, even if read from disk.
+_memo: dict[tuple[str, str], tuple[Any, float]] = {}
+_memo_lock = threading.Lock()
+
+
+def _remember(key: tuple[str, str], value: Any, cached_at: float) -> None:
+    with _memo_lock:
+        _memo[key] = (value, cached_at)
+        while len(_memo) > _MEMO_MAX_ENTRIES:
+            del _memo[next(iter(_memo))]
+
+
+def _recall(key: tuple[str, str], *, ttl_seconds: float | None) -> Any | None:
+    # Callers also check the disk entry still exists, so `wmt purge-cache` reaches a running watcher.
+    with _memo_lock:
+        hit = _memo.get(key)
+    if hit is None:
+        return None
+    value, cached_at = hit
+    if ttl_seconds is not None and time.time() - cached_at > ttl_seconds:
+        return None
+    return value
+
+
+def _cache_key(url: str) -> str | None:
+    # The id becomes a filename, so only accept the canonical 11-char form.
+    vid = youtube_video_id(url)
+    return vid if vid and _VIDEO_ID_RE.match(vid) else None
+
+
+def _read(path: Path, *, ttl_seconds: float | None) -> tuple[dict[str, Any], float] | None:
+    try:
+        data = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.debug("Ignoring unreadable YouTube cache entry %s: %s", path, e)
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("value"), dict):
+        return None
+    cached_at = float(data.get("cached_at") or 0)
+    if ttl_seconds is not None and time.time() - cached_at > ttl_seconds:
+        return None
+    return data["value"], cached_at
+
+
+def _write(path: Path, value: dict[str, Any]) -> float:
+    cached_at = time.time()
+    try:
+        atomic_write_text(path, json.dumps({"cached_at": cached_at, "value": value}))
+    except OSError as e:
+        log.debug("Could not write YouTube cache entry %s: %s", path, e)
+    return cached_at
+
+
+def get_cached_metadata(url: str, *, cache_dir: Path, timeout_seconds: int = 20) -> YouTubeMetadata | None:
+    """
+    `get_youtube_metadata`, cached per video id in memory and under `cache_dir` for a week.
+
+    Misses (None) are not cached, so a later run retries.
+    """
+    vid = _cache_key(url)
+    if vid is None:
+        return get_youtube_metadata(url, timeout_seconds=timeout_seconds)
+
+    path = cache_dir / f"{vid}.metadata.json"
+    hit = _recall(("metadata", vid), ttl_seconds=METADATA_TTL_SECONDS)
+    if hit is not None and path.exists():
+        return hit
+
+    entry = _read(path, ttl_seconds=METADATA_TTL_SECONDS)
+    meta: YouTubeMetadata | None = None
+    if entry is not None:
+        raw, cached_at = entry
+        try:
+            meta = YouTubeMetadata(**{**raw, "notes": tuple(raw.get("notes") or ())})
+        except TypeError:
+            meta = None
+    if meta is None:
+        meta = get_youtube_metadata(url, timeout_seconds=timeout_seconds)
+        if meta is None:
+            return None
+        cached_at = _write(path, asdict(meta))
+
+    _remember(("metadata", vid), meta, cached_at)
+    return meta
+
+
+def get_cached_transcript(url: str, *, cache_dir: Path, timeout_seconds: int = 20) -> YouTubeTranscript | None:
+    """
+    `get_youtube_transcript`, cached per video id in memory and under `cache_dir` indefinitely.
+
+    Misses (None) are not cached: captions are often added after upload.
+    """
+    vid = _cache_key(url)
+    if vid is None:
+        return get_youtube_transcript(url, timeout_seconds=timeout_seconds)
+
+    path = cache_dir / f"{vid}.transcript.json"
+    hit = _recall(("transcript", vid), ttl_seconds=None)
+    if hit is not None and path.exists():
+        return hit
+
+    entry = _read(path, ttl_seconds=None)
+    transcript: YouTubeTranscript | None = None
+    if entry is not None:
+        raw, cached_at = entry
+        try:
+            transcript = YouTubeTranscript(**{**raw, "notes": tuple(raw.get("notes") or ())})
+        except TypeError:
+            transcript = None
+    if transcript is None:
+        transcript = get_youtube_transcript(url, timeout_seconds=timeout_seconds)
+        if transcript is None or not transcript.text.strip():
+            return transcript
+        cached_at = _write(path, asdict(transcript))
+
+    _remember(("transcript", vid), transcript, cached_at)
+    return transcript
+
+
+def purge_cache(cache_dir: Path) -> int:
+    """Deletes every cached metadata/transcript entry under `cache_dir`; returns how many."""
+    with _memo_lock:
+        _memo.clear()
+    removed = 0
+    for path in cache_dir.glob("*.json"):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
@@ -45,6 +45,50 @@ class BookmarksParsingTests(unittest.TestCase):
             self.assertEqual(items[0].title, "Example")
             self.assertIsNotNone(items[0].date_added)
 
+    def test_loads_file_with_utf8_bom(self) -> None:
+        data = {
+            "roots": {
+                "bookmark_bar": {
+                    "type": "folder",
+                    "children": [
+                        {
+                            "type": "folder",
+                            "name": "Inbox",
+                            "children": [{"type": "url", "name": "Café", "url": "https://example.com/café"}],
+                        }
+                    ],
+                }
+            }
+        }
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "Bookmarks"
+            path.write_bytes(b"\xef\xbb\xbf" + json.dumps(data, ensure_ascii=False).encode("utf-8"))
+            items = load_brave_inbox_bookmarks(bookmarks_path=path)
+            self.assertEqual([i.title for i in items], ["Café"])
+            self.assertEqual(items[0].url, "https://example.com/café")
+
+    def test_reparses_when_file_changes(self) -> None:
+        def write(path: Path, urls: list[str]) -> None:
+            children = [{"type": "url", "name": u, "url": u} for u in urls]
+            data = {"roots": {"bookmark_bar": {"type": "folder", "children": [
+                {"type": "folder", "name": "Inbox", "children": children}
+            ]}}}
+            path.write_text(json.dumps(data), encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "Bookmarks"
+            write(path, ["https://a.example"])
+            first = load_brave_inbox_bookmarks(bookmarks_path=path)
+            self.assertEqual([i.url for i in first], ["https://a.example"])
+
+            # Callers may sort/mutate the returned list without affecting the cache.
+            first.clear()
+            self.assertEqual(len(load_brave_inbox_bookmarks(bookmarks_path=path)), 1)
+
+            write(path, ["https://a.example", "https://b.example"])
+            second = load_brave_inbox_bookmarks(bookmarks_path=path)
+            self.assertEqual([i.url for i in second], ["https://a.example", "https://b.example"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,22 +5,27 @@ from pathlib import Path as _Path
 
 sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
 
-from wmt.cli import _normalize_argv, build_parser
+from wmt.cli import build_parser
 
 
 class CliArgTests(unittest.TestCase):
     def test_config_after_subcommand_is_accepted(self) -> None:
         parser = build_parser()
-        args = parser.parse_args(
-            _normalize_argv(["watch", "--once", "--config", "/tmp/wmt_config.yaml"])
-        )
+        args = parser.parse_args(["watch", "--once", "--config", "/tmp/wmt_config.yaml"])
         self.assertEqual(args.cmd, "watch")
         self.assertTrue(args.once)
         self.assertEqual(args.config, "/tmp/wmt_config.yaml")
 
     def test_verbose_after_subcommand_is_accepted(self) -> None:
         parser = build_parser()
-        args = parser.parse_args(_normalize_argv(["watch", "--once", "--verbose"]))
+        args = parser.parse_args(["watch", "--once", "--verbose"])
+        self.assertTrue(args.verbose)
+
+    def test_global_flags_before_subcommand_are_kept(self) -> None:
+        parser = build_parser()
+        args = parser.parse_args(["--config", "/tmp/wmt_config.yaml", "-v", "status"])
+        self.assertEqual(args.cmd, "status")
+        self.assertEqual(args.config, "/tmp/wmt_config.yaml")
         self.assertTrue(args.verbose)
 
 
@@ -1,30 +1,61 @@
 import unittest
+from pathlib import Path
 
 import sys
 from pathlib import Path as _Path
 
 sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
 
-from wmt.codex_runner import _inject_reasoning_effort, _inject_web_search
+from wmt.codex_runner import _build_codex_cmd
+from wmt.config import CodexConfig
+
+
+def _cfg(*, web_search: bool = False, model: str = "", effort: str = "") -> CodexConfig:
+    return CodexConfig(
+        enabled=True,
+        command=(),
+        model=model,
+        model_reasoning_effort=effort,
+        web_search_enabled=web_search,
+        timeout_seconds=60,
+    )
 
 
 class CodexRunnerArgTests(unittest.TestCase):
     def test_inject_web_search_before_exec(self) -> None:
         cmd = ["codex", "exec", "--sandbox", "read-only", "-"]
-        out = _inject_web_search(cmd, True)
+        out = _build_codex_cmd(cmd, _cfg(web_search=True), output_path=Path("/tmp/out.txt"))
         self.assertEqual(out[:3], ["codex", "--search", "exec"])
 
     def test_inject_web_search_no_duplicates(self) -> None:
-        cmd = ["codex", "--search", "exec", "-"]
-        out = _inject_web_search(cmd, True)
+        cmd = ["codex", "--search", "exec", "-o", "/tmp/out.txt", "-"]
+        out = _build_codex_cmd(cmd, _cfg(web_search=True), output_path=Path("/tmp/other.txt"))
         self.assertEqual(out, cmd)
 
     def test_inject_reasoning_effort_quotes_value(self) -> None:
         cmd = ["codex", "exec", "-"]
-        out = _inject_reasoning_effort(cmd, "xhigh")
+        out = _build_codex_cmd(cmd, _cfg(effort="xhigh"), output_path=Path("/tmp/out.txt"))
         joined = " ".join(out)
         self.assertIn('model_reasoning_effort="xhigh"', joined)
 
+    def test_injected_flags_go_before_prompt_dash(self) -> None:
+        cmd = ["codex", "exec", "--sandbox", "read-only"]
+        out = _build_codex_cmd(cmd, _cfg(model="gpt-x"), output_path=Path("/tmp/out.txt"))
+        self.assertEqual(
+            out,
+            [
+                "codex",
+                "exec",
+                "--sandbox",
+                "read-only",
+                "--output-last-message",
+                "/tmp/out.txt",
+                "--model",
+                "gpt-x",
+                "-",
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+import sys
+from pathlib import Path as _Path
+
+sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
+
+from wmt.fetch import _decode_body, _is_textual
+
+
+class DecodeBodyTests(unittest.TestCase):
+    def test_bom_wins_over_declared_charset(self) -> None:
+        body = b"\xef\xbb\xbf<p>caf\xc3\xa9</p>"
+        self.assertEqual(_decode_body(body, content_type="text/html; charset=iso-8859-1"), "<p>café</p>")
+        self.assertEqual(_decode_body("<p>hi</p>".encode("utf-16"), content_type=None), "<p>hi</p>")
+
+    def test_declared_then_meta_then_utf8(self) -> None:
+        self.assertEqual(_decode_body(b"caf\xe9", content_type="text/html; charset=latin-1"), "café")
+        self.assertEqual(
+            _decode_body(b'<meta charset="windows-1252"><p>\x93q\x94</p>', content_type="text/html"),
+            '<meta charset="windows-1252"><p>“q”</p>',
+        )
+        self.assertEqual(_decode_body("ünï".encode("utf-8"), content_type=None), "ünï")
+        self.assertEqual(_decode_body(b"plain ascii", content_type=None), "plain ascii")
+
+
+class ContentTypeTests(unittest.TestCase):
+    def test_only_textual_bodies_are_downloaded(self) -> None:
+        for ct in (None, "text/html; charset=utf-8", "application/json", "application/rss+xml"):
+            self.assertTrue(_is_textual(ct), ct)
+        for ct in ("application/pdf", "video/mp4", "image/png"):
+            self.assertFalse(_is_textual(ct), ct)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import sys
@@ -7,47 +8,119 @@ from pathlib import Path as _Path
 
 sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
 
-from wmt.state import open_state_store
+from wmt.state import ThreadSafeStateStore, open_state_store
 
 
 class StateStoreTests(unittest.TestCase):
     def test_idempotency_and_status(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            # The sqlite ledger runs in memory here; test_reload_sees_other_writers covers a file.
+            for backend, path in (("json", Path(td) / "state.json"), ("sqlite", Path(":memory:"))):
+                with self.subTest(backend=backend):
+                    s = open_state_store(path=path, backend=backend)
+                    try:
+                        sha = f"abc123_{backend}"
+                        source = Path("/tmp/a.m4a")
+                        mtime_ns = 123
+                        size = 456
+
+                        self.assertFalse(s.is_processed(sha))
+
+                        s.mark_in_progress(
+                            sha,
+                            source,
+                            source_mtime_ns=mtime_ns,
+                            source_size=size,
+                            force=True,
+                        )
+                        self.assertFalse(s.is_processed(sha))
+                        self.assertFalse(s.allow_retry_in_progress(sha, ttl_seconds=3600))
+
+                        s.mark_processed(
+                            sha,
+                            archive_path=Path("/tmp/archive/a.m4a"),
+                            topic_file=Path("/tmp/topic.md"),
+                            codex_status="ok",
+                            source_path=source,
+                            source_mtime_ns=mtime_ns,
+                            source_size=size,
+                        )
+                        self.assertTrue(s.is_processed(sha))
+                        self.assertTrue(s.is_source_processed(source, source_mtime_ns=mtime_ns, source_size=size))
+                        self.assertFalse(s.allow_retry_in_progress(sha, ttl_seconds=0))
+                    finally:
+                        s.close()
+
+    def test_thread_safe_store_shared_across_threads(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             for backend, filename in (("json", "state.json"), ("sqlite", "state.sqlite3")):
-                path = Path(td) / filename
-                s = open_state_store(path=path, backend=backend)
-                try:
-                    sha = f"abc123_{backend}"
-                    source = Path("/tmp/a.m4a")
-                    mtime_ns = 123
-                    size = 456
-
-                    self.assertFalse(s.is_processed(sha))
-
-                    s.mark_in_progress(
-                        sha,
-                        source,
-                        source_mtime_ns=mtime_ns,
-                        source_size=size,
-                        force=True,
-                    )
-                    self.assertFalse(s.is_processed(sha))
-                    self.assertFalse(s.allow_retry_in_progress(sha, ttl_seconds=3600))
-
-                    s.mark_processed(
-                        sha,
-                        archive_path=Path("/tmp/archive/a.m4a"),
-                        topic_file=Path("/tmp/topic.md"),
-                        codex_status="ok",
-                        source_path=source,
-                        source_mtime_ns=mtime_ns,
-                        source_size=size,
-                    )
-                    self.assertTrue(s.is_processed(sha))
-                    self.assertTrue(s.is_source_processed(source, source_mtime_ns=mtime_ns, source_size=size))
-                    self.assertFalse(s.allow_retry_in_progress(sha, ttl_seconds=0))
-                finally:
-                    s.close()
+                with self.subTest(backend=backend):
+                    s = ThreadSafeStateStore(open_state_store(path=Path(td) / filename, backend=backend))
+                    try:
+                        with ThreadPoolExecutor(max_workers=4) as pool:
+                            list(pool.map(lambda i: s.mark_failed(f"sha{i}", "boom"), range(20)))
+                        self.assertEqual(s.stats()["failed"], 20)
+                    finally:
+                        s.close()
+
+    def test_json_updates_are_journaled_until_close(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "state.json"
+            journal = Path(td) / "state.json.journal"
+            s = open_state_store(path=path, backend="json")
+            s.mark_failed("sha1", "boom")
+            s.mark_processed("sha2", archive_path=None, topic_file=None, codex_status="ok")
+            self.assertTrue(journal.exists())
+
+            # Not closed (e.g. a crash): the journal is replayed on the next open.
+            reopened = open_state_store(path=path, backend="json")
+            self.assertEqual(reopened.stats()["failed"], 1)
+            self.assertTrue(reopened.is_processed("sha2"))
+            reopened.close()
+
+            self.assertFalse(journal.exists())
+            self.assertIn("sha2", path.read_text(encoding="utf-8"))
+
+    def test_json_torn_journal_line_does_not_swallow_next_update(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "state.json"
+            journal = Path(td) / "state.json.journal"
+            s = open_state_store(path=path, backend="json")
+            s.mark_failed("sha1", "boom")
+            # Simulate a crash part-way through the next append.
+            with journal.open("ab") as f:
+                f.write(b'{"sha256": "sha2", "rec')
+
+            reopened = open_state_store(path=path, backend="json")
+            reopened.mark_failed("sha3", "boom")
+            again = open_state_store(path=path, backend="json")
+            self.assertEqual(again.stats()["failed"], 2)
+            self.assertFalse(again.is_processed("sha2"))
+
+            # A writer that hasn't replayed the torn line must not glue onto it either.
+            with journal.open("ab") as f:
+                f.write(b'{"sha256": "sha4", "rec')
+            again.mark_failed("sha5", "boom")
+            self.assertEqual(open_state_store(path=path, backend="json").stats()["failed"], 3)
+
+    def test_reload_sees_other_writers(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            for backend, filename in (("json", "state.json"), ("sqlite", "state.sqlite3")):
+                with self.subTest(backend=backend):
+                    path = Path(td) / filename
+                    watcher = open_state_store(path=path, backend=backend)
+                    other = open_state_store(path=path, backend=backend)
+                    try:
+                        watcher.mark_failed("sha1", "boom")
+                        other.reload()
+                        other.mark_processed("sha2", archive_path=None, topic_file=None, codex_status="ok")
+                        other.close()
+
+                        watcher.reload()
+                        self.assertTrue(watcher.is_processed("sha2"))
+                        self.assertEqual(watcher.stats()["failed"], 1)
+                    finally:
+                        watcher.close()
 
 
 if __name__ == "__main__":
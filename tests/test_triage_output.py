@@ -0,0 +1,34 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import sys
+from pathlib import Path as _Path
+
+sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
+
+from wmt.triage_output import triage_output_path
+
+
+class TriageOutputPathTests(unittest.TestCase):
+    def test_picks_first_free_suffix(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td)
+            self.assertEqual(triage_output_path(out, title="Hello, World!").name, "hello-world.md")
+
+            (out / "Hello-World-2.md").touch()
+            (out / "hello-world-3.md").touch()
+            self.assertEqual(triage_output_path(out, title="Hello, World!").name, "hello-world-4.md")
+
+    def test_concurrent_callers_get_distinct_reserved_files(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td) / "new"
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                paths = list(pool.map(lambda _: triage_output_path(out, title=None), range(8)))
+            self.assertEqual(len(set(paths)), 8)
+            self.assertTrue(all(p.exists() for p in paths))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+from pathlib import Path as _Path
+
+sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
+
+from wmt.triage_prompt import build_triage_prompt
+
+
+class TriagePromptTests(unittest.TestCase):
+    def test_fills_first_occurrence_of_each_slot_only(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            prompt_file = Path(td) / "prompt.md"
+            prompt_file.write_text(
+                "Link: {LINK}\nMeta: {METADATA}\nTranscript: {TRANSCRIPT}\nOut: {OUTPUT_FILE}\n"
+                "If {TRANSCRIPT} is empty, use {LINK}.\n",
+                encoding="utf-8",
+            )
+            prompt = build_triage_prompt(
+                link="https://example.com/{TRANSCRIPT}",
+                transcript="hello",
+                metadata="",
+                output_file="/tmp/out.md",
+                prompt_file=prompt_file,
+            )
+        self.assertEqual(
+            prompt,
+            "Link: https://example.com/{TRANSCRIPT}\nMeta: \nTranscript: hello\nOut: /tmp/out.md\n"
+            "If {TRANSCRIPT} is empty, use {LINK}.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,11 @@ class UrlNormalizationTests(unittest.TestCase):
         url = "https://example.com/a/b?utm_source=x&x=1#section"
         self.assertEqual(normalize_url(url), "https://example.com/a/b?x=1")
 
+    def test_query_is_decoded_filtered_and_sorted(self) -> None:
+        # Normalized URLs are hashed into ledger identities, so this exact output must not drift.
+        url = "https://example.com/p?b=x%20y&A=2&a=1&q=a+b&utm_medium=z&Ref=r"
+        self.assertEqual(normalize_url(url), "https://example.com/p?a=1&A=2&b=x y&q=a b")
+
     def test_canonicalizes_youtube_watch(self) -> None:
         url = "https://www.youtube.com/watch?v=abc123&t=10s&utm_source=x"
         self.assertEqual(normalize_url(url), "https://www.youtube.com/watch?v=abc123")
@@ -0,0 +1,33 @@
+import unittest
+
+import sys
+from pathlib import Path as _Path
+
+sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
+
+from wmt.youtube_transcripts import _srt_to_text, _vtt_to_text
+
+
+class SubtitleParsingTests(unittest.TestCase):
+    def test_vtt_keeps_cues_and_text_only(self) -> None:
+        vtt = (
+            "WEBVTT\r\nKind: captions\r\n\r\nNOTE generated\r\n\r\n1\r\n"
+            "00:00:01.000 --> 00:00:02.000 align:start\r\n  Hello there  \r\n\r\n"
+            "2\r00:00:02.000 --> 00:00:03.000\rworld\r"
+        )
+        self.assertEqual(
+            _vtt_to_text(vtt),
+            "Kind: captions\n[00:00:01.000 --> 00:00:02.000 align:start]\nHello there\n"
+            "[00:00:02.000 --> 00:00:03.000]\nworld",
+        )
+
+    def test_srt_drops_sequence_numbers(self) -> None:
+        srt = "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n2\n00:00:02,000 --> 00:00:03,000\nworld\n"
+        self.assertEqual(
+            _srt_to_text(srt),
+            "[00:00:01,000 --> 00:00:02,000]\nHello\n[00:00:02,000 --> 00:00:03,000]\nworld",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+from pathlib import Path as _Path
+
+sys.path.insert(0, str(_Path(__file__).resolve().parents[1] / "src"))
+
+from wmt import yt_cache
+from wmt.youtube_metadata import YouTubeMetadata
+from wmt.youtube_transcripts import YouTubeTranscript
+
+
+class YouTubeCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._orig = yt_cache.get_youtube_transcript
+        self._orig_metadata = yt_cache.get_youtube_metadata
+        yt_cache._memo.clear()
+
+    def tearDown(self) -> None:
+        yt_cache.get_youtube_transcript = self._orig
+        yt_cache.get_youtube_metadata = self._orig_metadata
+        yt_cache._memo.clear()
+
+    def test_transcript_is_cached_on_disk_and_misses_are_not(self) -> None:
+        calls: list[str] = []
+        result: list[YouTubeTranscript | None] = [None]
+
+        def fake(url: str, *, timeout_seconds: int = 20) -> YouTubeTranscript | None:
+            calls.append(url)
+            return result[0]
+
+        yt_cache.get_youtube_transcript = fake
+        url = "https://www.youtube.com/watch?v=abcdefghijk"
+        with tempfile.TemporaryDirectory() as td:
+            cache_dir = Path(td)
+            self.assertIsNone(yt_cache.get_cached_transcript(url, cache_dir=cache_dir))
+
+            result[0] = YouTubeTranscript(text="[00:00] hi", source="test", language="en", is_auto=False)
+            first = yt_cache.get_cached_transcript(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 2)
+
+            yt_cache._memo.clear()  # force a read from disk
+            second = yt_cache.get_cached_transcript(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(first, second)
+
+            # Another process purging the directory also invalidates this process's memo.
+            for path in cache_dir.iterdir():
+                path.unlink()
+            yt_cache.get_cached_transcript(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 3)
+
+            self.assertEqual(yt_cache.purge_cache(cache_dir), 1)
+            self.assertEqual(list(cache_dir.iterdir()), [])
+            yt_cache.get_cached_transcript(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 4)
+
+    def test_memoized_metadata_expires_with_the_disk_ttl(self) -> None:
+        calls: list[str] = []
+
+        def fake(url: str, *, timeout_seconds: int = 20) -> YouTubeMetadata:
+            calls.append(url)
+            return YouTubeMetadata(
+                title="t", channel=None, channel_url=None, upload_date=None, duration_seconds=None, source="test"
+            )
+
+        yt_cache.get_youtube_metadata = fake
+        url = "https://www.youtube.com/watch?v=abcdefghijk"
+        with tempfile.TemporaryDirectory() as td:
+            cache_dir = Path(td)
+            yt_cache.get_cached_metadata(url, cache_dir=cache_dir)
+            yt_cache.get_cached_metadata(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 1)
+
+            # Age both the memo entry and the file past the TTL.
+            key = ("metadata", "abcdefghijk")
+            value, cached_at = yt_cache._memo[key]
+            yt_cache._memo[key] = (value, cached_at - yt_cache.METADATA_TTL_SECONDS - 1)
+            path = cache_dir / "abcdefghijk.metadata.json"
+            path.write_text(path.read_text().replace(str(cached_at), "0"))
+            yt_cache.get_cached_metadata(url, cache_dir=cache_dir)
+            self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()